@@ -141,15 +141,21 @@ class Settings:
     api_retry_count: int = 3
     api_retry_delay: float = 1.0
     api_timeout: int = 30
+    api_max_workers: int = 8  # Concurrent API requests per client
+    
+    # Output settings
+    verbose: bool = True  # Per-client progress messages
     
     # Cache settings
     cache_enabled: bool = True
     cache_ttl_hours: int = 24
+    cache_stale_days: int = 7  # How long stale_ok results remain a fallback
     
     # Report settings
     default_row_limit: int = 100
     top_keywords_limit: int = 25
     top_pages_limit: int = 20
+    fast_mode: bool = False  # Skip detail that only feeds deep-dive sections
     
     # Benchmark data (typical nonprofit averages)
     benchmarks: dict = field(default_factory=lambda: {
@@ -667,6 +667,8 @@ if pagespeed.get('available'):
     with tab_pagespeed:
         st.markdown("### ⚡ PageSpeed Insights")
         st.caption("Site performance analysis from Google PageSpeed Insights")
+        if pagespeed.get('data_as_of'):
+            st.info(f"PageSpeed API unavailable; showing data as of {pagespeed['data_as_of']}")
         
         summary = pagespeed.get('summary', {})
         mobile = pagespeed.get('mobile', {})
@@ -762,6 +764,8 @@ if hotjar.get('available'):
     with tab_hotjar:
         st.markdown("### 🔥 Hotjar User Feedback")
         st.caption("User sentiment and feedback from Hotjar")
+        if hotjar.get('data_as_of'):
+            st.info(f"Hotjar API unavailable; showing data as of {hotjar['data_as_of']}")
         
         hj_summary = hotjar.get('summary', {})
         feedback = hotjar.get('feedback', {})
@@ -4,12 +4,18 @@ Trend Analysis
 Identify patterns, trends, and anomalies in time-series data.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
+import math
 import pandas as pd
 import numpy as np
 
 
+# Below this length NumPy call overhead outweighs the arithmetic, so
+# analyze_trend fits the line in plain Python instead.
+SMALL_SERIES_MAX = 128
+
+
 @dataclass
 class TrendResult:
     """Result of trend analysis."""
@@ -45,6 +51,16 @@ class TrendAnalyzer:
         """
         self.sensitivity = sensitivity
     
+    @property
+    def sensitivity(self) -> float:
+        return self._sensitivity
+    
+    @sensitivity.setter
+    def sensitivity(self, value: float) -> None:
+        # Rebuild the anomaly scan so it always matches the current sensitivity
+        self._sensitivity = value
+        self._scan = _make_scan_kernel(value)
+    
     def analyze_trend(
         self,
         data: pd.DataFrame,
@@ -72,7 +88,28 @@ class TrendAnalyzer:
             )
         
         # Convert to numeric index for regression
-        values = data[value_col].values
+        values = _float_values(data, value_col)
+        if values is None:
+            return TrendResult(
+                direction="stable",
+                strength=0,
+                slope=0,
+                description="Unable to calculate trend",
+                significant=False
+            )
+        
+        if values.size < SMALL_SERIES_MAX:
+            stats = _small_trend_stats(values.tolist())
+            if stats is None:
+                return TrendResult(
+                    direction="stable",
+                    strength=0,
+                    slope=0,
+                    description="Unable to calculate trend",
+                    significant=False
+                )
+            return self._build_trend_result(*stats)
+        
         x = np.arange(len(values))
         
         # Calculate linear regression
@@ -93,8 +130,76 @@ class TrendAnalyzer:
         ss_tot = np.sum((values - np.mean(values)) ** 2)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
         
+        return self._build_trend_result(slope, r_squared, np.mean(values), np.std(values))
+    
+    def analyze_trends_batch(
+        self,
+        series: Dict[str, np.ndarray]
+    ) -> Dict[str, TrendResult]:
+        """
+        Analyze trends for many series at once.
+        
+        Series of equal length are stacked into a matrix so slope and
+        R-squared are computed for the whole group in a few array operations
+        rather than one polyfit per series. Ragged inputs are grouped by length.
+        
+        Args:
+            series: Mapping of series name to 1-D array of values
+        
+        Returns:
+            Mapping of series name to TrendResult
+        """
+        results = {}
+        by_length: Dict[int, List[str]] = {}
+        for name, values in series.items():
+            by_length.setdefault(len(values), []).append(name)
+        
+        for n, names in by_length.items():
+            if n < 3:
+                for name in names:
+                    results[name] = TrendResult(
+                        direction="stable",
+                        strength=0,
+                        slope=0,
+                        description="Insufficient data for trend analysis",
+                        significant=False
+                    )
+                continue
+            
+            Y = np.vstack([np.asarray(series[name], dtype=float) for name in names])
+            x = np.arange(n, dtype=float)
+            sx = x.sum()
+            sxx = x @ x
+            sy = Y.sum(axis=1)
+            sxy = Y @ x
+            
+            slopes = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+            intercepts = (sy - slopes * sx) / n
+            means = sy / n
+            
+            centered = Y - means[:, None]
+            ss_tot = np.einsum('ij,ij->i', centered, centered)
+            residuals = Y - (slopes[:, None] * x + intercepts[:, None])
+            ss_res = np.einsum('ij,ij->i', residuals, residuals)
+            r_squared = np.where(ss_tot > 0, 1 - ss_res / np.where(ss_tot > 0, ss_tot, 1), 0.0)
+            stds = np.sqrt(ss_tot / n)
+            
+            for i, name in enumerate(names):
+                results[name] = self._build_trend_result(
+                    slopes[i], r_squared[i], means[i], stds[i]
+                )
+        
+        return results
+    
+    def _build_trend_result(
+        self,
+        slope: float,
+        r_squared: float,
+        mean_value: float,
+        std_value: float
+    ) -> TrendResult:
+        """Classify a fitted trend and describe it."""
         # Determine direction and significance
-        mean_value = np.mean(values)
         relative_slope = (slope / mean_value * 100) if mean_value != 0 else 0
         
         if abs(relative_slope) < 1:
@@ -105,7 +210,7 @@ class TrendAnalyzer:
             direction = "decreasing"
         
         # Check for volatility
-        cv = np.std(values) / mean_value if mean_value != 0 else 0
+        cv = std_value / mean_value if mean_value != 0 else 0
         if cv > 0.5:
             direction = "volatile"
         
@@ -150,36 +255,136 @@ class TrendAnalyzer:
         if data.empty or len(data) < 5:
             return []
         
-        values = data[value_col].values
-        mean_val = np.mean(values)
-        std_val = np.std(values)
+        values = _float_values(data, value_col)
+        if values is None:
+            return []
+        mean_val, std_val = _mean_std(values)
+        return self._detect(
+            values, data[date_col], mean_val, std_val, min_deviation, value_col
+        )
+    
+    def detect_anomalies_from_stats(
+        self,
+        data: pd.DataFrame,
+        date_col: str,
+        value_col: str,
+        mean_val: float,
+        std_val: float,
+        min_deviation: float = None
+    ) -> List[AnomalyResult]:
+        """
+        Detect anomalies using precomputed statistics.
         
-        if std_val == 0:
+        Lets callers that already ran get_period_summary on the same column
+        pass its 'mean' and 'std' instead of scanning the data again. The
+        statistics must describe exactly this column, with std computed as
+        the population standard deviation (ddof=0).
+        
+        Args:
+            data: DataFrame with date and value columns
+            date_col: Name of date column
+            value_col: Name of value column
+            mean_val: Mean of the value column
+            std_val: Population standard deviation of the value column
+            min_deviation: Minimum % deviation to flag (default uses sensitivity)
+        
+        Returns:
+            List of detected anomalies
+        """
+        if data.empty or len(data) < 5:
             return []
         
-        anomalies = []
-        threshold = self.sensitivity * std_val
-        min_deviation = min_deviation or (self.sensitivity * 50)  # Default 100% deviation
+        values = _float_values(data, value_col)
+        if values is None:
+            return []
+        return self._detect(
+            values, data[date_col], mean_val, std_val, min_deviation, value_col
+        )
+    
+    def detect_anomalies_columnar(
+        self,
+        data: pd.DataFrame,
+        date_col: str,
+        value_col: str,
+        min_deviation: float = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Detect anomalies and return them as parallel arrays.
         
-        for idx, row in data.iterrows():
-            value = row[value_col]
-            deviation = abs(value - mean_val)
-            
-            if deviation > threshold:
-                deviation_pct = (value - mean_val) / mean_val * 100 if mean_val != 0 else 0
-                
-                if abs(deviation_pct) >= min_deviation:
-                    anomalies.append(AnomalyResult(
-                        date=str(row[date_col]),
-                        metric=value_col,
-                        value=value,
-                        expected_range=(mean_val - std_val, mean_val + std_val),
-                        deviation_pct=deviation_pct,
-                        type="spike" if value > mean_val else "drop"
-                    ))
+        Same selection as detect_anomalies, but without building one
+        AnomalyResult per hit; pd.DataFrame(result) wraps it directly.
+        
+        Returns:
+            Dict with 'date', 'value', 'deviation_pct', 'type',
+            'expected_low' and 'expected_high' arrays of equal length
+        """
+        if data.empty or len(data) < 5:
+            return _empty_anomaly_columns()
+        
+        values = _float_values(data, value_col)
+        if values is None:
+            return _empty_anomaly_columns()
+        mean_val, std_val = _mean_std(values)
+        return self._detect_columns(
+            values, data[date_col], mean_val, std_val, min_deviation
+        )
+    
+    def _detect(
+        self,
+        values: np.ndarray,
+        dates: pd.Series,
+        mean_val: float,
+        std_val: float,
+        min_deviation: Optional[float],
+        value_col: str
+    ) -> List[AnomalyResult]:
+        """Flag values outside the sensitivity band around mean_val."""
+        columns = self._detect_columns(values, dates, mean_val, std_val, min_deviation)
+        
+        # Loop-invariant; every result shares the same immutable tuple
+        expected_range = (float(mean_val - std_val), float(mean_val + std_val))
+        
+        anomalies = []
+        for date, value, pct, kind in zip(
+            columns['date'], columns['value'].tolist(),
+            columns['deviation_pct'].tolist(), columns['type'].tolist()
+        ):
+            anomalies.append(AnomalyResult(
+                date=date,
+                metric=value_col,
+                value=value,
+                expected_range=expected_range,
+                deviation_pct=pct,
+                type=kind
+            ))
         
         return anomalies
     
+    def _detect_columns(
+        self,
+        values: np.ndarray,
+        dates: pd.Series,
+        mean_val: float,
+        std_val: float,
+        min_deviation: Optional[float]
+    ) -> Dict[str, np.ndarray]:
+        """Columnar core shared by detect_anomalies and detect_anomalies_columnar."""
+        if std_val == 0:
+            return _empty_anomaly_columns()
+        
+        mask, deviation_pct = self._scan(values, mean_val, std_val, min_deviation)
+        
+        hits = np.flatnonzero(mask)
+        hit_values = values[hits]
+        return {
+            'date': np.array([str(d) for d in dates.iloc[hits]], dtype=object),
+            'value': hit_values,
+            'deviation_pct': deviation_pct[hits],
+            'type': np.where(hit_values > mean_val, 'spike', 'drop'),
+            'expected_low': np.full(hits.size, mean_val - std_val),
+            'expected_high': np.full(hits.size, mean_val + std_val),
+        }
+    
     def compare_periods(
         self,
         current: pd.DataFrame,
@@ -194,28 +399,52 @@ class TrendAnalyzer:
         if current.empty or previous.empty:
             return {}
         
-        curr_values = current[value_col].values
-        prev_values = previous[value_col].values
+        return self.compare_periods_batch(current, previous, [value_col])[value_col]
+    
+    def compare_periods_batch(
+        self,
+        current: pd.DataFrame,
+        previous: pd.DataFrame,
+        value_cols: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compare several metrics between two periods in one pass.
+        
+        Returns a compare_periods-style dict per column.
+        """
+        if current.empty or previous.empty:
+            return {}
+        
+        curr_values = current[value_cols].to_numpy(dtype=np.float64)
+        prev_values = previous[value_cols].to_numpy(dtype=np.float64)
         
-        curr_mean = np.mean(curr_values)
-        prev_mean = np.mean(prev_values)
-        curr_total = np.sum(curr_values)
-        prev_total = np.sum(prev_values)
+        curr_mean = curr_values.mean(axis=0)
+        prev_mean = prev_values.mean(axis=0)
+        curr_total = curr_values.sum(axis=0)
+        prev_total = prev_values.sum(axis=0)
         
-        mean_change = ((curr_mean - prev_mean) / prev_mean * 100) if prev_mean else 0
-        total_change = ((curr_total - prev_total) / prev_total * 100) if prev_total else 0
+        mean_change = _pct_change(curr_mean, prev_mean)
+        total_change = _pct_change(curr_total, prev_total)
+        
+        curr_min = curr_values.min(axis=0)
+        curr_max = curr_values.max(axis=0)
+        prev_min = prev_values.min(axis=0)
+        prev_max = prev_values.max(axis=0)
         
         return {
-            'current_mean': curr_mean,
-            'previous_mean': prev_mean,
-            'mean_change_pct': mean_change,
-            'current_total': curr_total,
-            'previous_total': prev_total,
-            'total_change_pct': total_change,
-            'current_min': np.min(curr_values),
-            'current_max': np.max(curr_values),
-            'previous_min': np.min(prev_values),
-            'previous_max': np.max(prev_values),
+            col: {
+                'current_mean': curr_mean[i],
+                'previous_mean': prev_mean[i],
+                'mean_change_pct': mean_change[i],
+                'current_total': curr_total[i],
+                'previous_total': prev_total[i],
+                'total_change_pct': total_change[i],
+                'current_min': curr_min[i],
+                'current_max': curr_max[i],
+                'previous_min': prev_min[i],
+                'previous_max': prev_max[i],
+            }
+            for i, col in enumerate(value_cols)
         }
     
     def get_period_summary(
@@ -230,16 +459,148 @@ class TrendAnalyzer:
         if data.empty:
             return {}
         
-        values = data[value_col].values
+        values = _float_values(data, value_col)
+        if values is None:
+            return {}
+        
+        # Sort once; median, quartiles and extremes are all read from it
+        sorted_values = np.sort(values)
         
         return {
             'count': len(values),
             'sum': float(np.sum(values)),
             'mean': float(np.mean(values)),
-            'median': float(np.median(values)),
+            'median': _sorted_quantile(sorted_values, 0.5),
+            'p25': _sorted_quantile(sorted_values, 0.25),
+            'p75': _sorted_quantile(sorted_values, 0.75),
             'std': float(np.std(values)),
-            'min': float(np.min(values)),
-            'max': float(np.max(values)),
-            'range': float(np.max(values) - np.min(values)),
+            'min': float(sorted_values[0]),
+            'max': float(sorted_values[-1]),
+            'range': float(sorted_values[-1] - sorted_values[0]),
         }
 
+
+def _float_values(data: pd.DataFrame, column: str) -> Optional[np.ndarray]:
+    """
+    Return a column as a contiguous float64 array, or None if it isn't numeric.
+    
+    Float columns come back without a copy; mixed or object columns are
+    converted (or rejected) up front instead of dragging Python-object
+    arithmetic through every NumPy call.
+    """
+    try:
+        values = data[column].to_numpy(dtype=np.float64, copy=False)
+    except (TypeError, ValueError):
+        return None
+    return np.ascontiguousarray(values)
+
+
+def _small_trend_stats(
+    values: List[float]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Single-pass least-squares fit for short series.
+    
+    Returns (slope, r_squared, mean, std) or None when the data contains
+    non-finite values. Values are shifted by the first element and x is
+    centered so the running sums stay well conditioned.
+    """
+    n = len(values)
+    shift = values[0]
+    x_mean = (n - 1) / 2
+    sd = sdd = sxd = 0.0
+    for i, y in enumerate(values):
+        d = y - shift
+        sd += d
+        sdd += d * d
+        sxd += (i - x_mean) * d
+    
+    if not (math.isfinite(sd) and math.isfinite(sdd)):
+        return None
+    
+    sxx = n * (n * n - 1) / 12
+    ss_tot = max(sdd - sd * sd / n, 0.0)
+    slope = sxd / sxx
+    ss_res = max(ss_tot - slope * sxd, 0.0)
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+    
+    return slope, r_squared, shift + sd / n, math.sqrt(ss_tot / n)
+
+
+def _mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and population std (ddof=0) from one sum and one dot product.
+    
+    Equivalent to np.mean/np.std. E[d^2] - E[d]^2 is taken over values
+    shifted by the first value, as in _small_trend_stats, so a large baseline
+    (e.g. 1e8 with a std near 1) doesn't cancel the variance to zero.
+    """
+    shift = values[0]
+    d = values - shift
+    n = d.size
+    d_mean = d.sum() / n
+    var = max(np.dot(d, d) / n - d_mean * d_mean, 0.0)
+    return shift + d_mean, np.sqrt(var)
+
+
+def _make_scan_kernel(sensitivity: float) -> Callable[..., Tuple[np.ndarray, np.ndarray]]:
+    """
+    Build the anomaly mask function for a fixed sensitivity.
+    
+    The sensitivity and its default minimum deviation are bound once per
+    analyzer instead of being recomputed on every detect call.
+    """
+    default_min_deviation = sensitivity * 50  # Default 100% deviation
+    
+    def scan(
+        values: np.ndarray,
+        mean_val: float,
+        std_val: float,
+        min_deviation: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        threshold = sensitivity * std_val
+        min_dev = min_deviation or default_min_deviation
+        
+        # Evaluate both thresholds as one vectorized mask instead of per-row branches
+        diff = values - mean_val
+        if mean_val != 0:
+            deviation_pct = diff / mean_val * 100
+        else:
+            deviation_pct = np.zeros_like(diff, dtype=float)
+        mask = (np.abs(diff) > threshold) & (np.abs(deviation_pct) >= min_dev)
+        return mask, deviation_pct
+    
+    return scan
+
+
+def _empty_anomaly_columns() -> Dict[str, np.ndarray]:
+    """Columnar anomaly result with no rows."""
+    return {
+        'date': np.array([], dtype=object),
+        'value': np.array([], dtype=np.float64),
+        'deviation_pct': np.array([], dtype=np.float64),
+        'type': np.array([], dtype='<U5'),
+        'expected_low': np.array([], dtype=np.float64),
+        'expected_high': np.array([], dtype=np.float64),
+    }
+
+
+def _pct_change(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """Element-wise % change, 0 where the previous value is 0."""
+    nonzero = previous != 0
+    safe_previous = np.where(nonzero, previous, 1)
+    return np.where(nonzero, (current - previous) / safe_previous * 100, 0.0)
+
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """
+    Linearly interpolated quantile of an already-sorted array.
+    
+    Matches np.quantile's default method without re-partitioning the data.
+    """
+    pos = (sorted_values.size - 1) * q
+    lower = int(np.floor(pos))
+    upper = min(lower + 1, sorted_values.size - 1)
+    frac = pos - lower
+    return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * frac)
+
@@ -12,13 +12,21 @@ This client provides access to all key metrics needed for quarterly reports:
 - Conversion tracking (events, goals)
 """
 
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Callable, Set, Tuple
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+from google.analytics.data_v1beta import (
+    BetaAnalyticsDataClient,
+    BetaAnalyticsDataAsyncClient,
+)
 from google.analytics.data_v1beta.types import (
     RunReportRequest,
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Metric,
@@ -26,12 +34,334 @@ from google.analytics.data_v1beta.types import (
     Filter,
     OrderBy,
     MetricAggregation,
+    MetricType,
 )
 from google.oauth2 import service_account
 
 from config.settings import ClientConfig, get_settings
 from src.utils.cache import cached
-from src.utils.formatting import format_duration
+from src.utils.formatting import format_duration_array
+
+
+# The Data API accepts at most this many requests per batchRunReports call
+BATCH_SIZE = 5
+
+# ...and at most this many metrics per report
+MAX_METRICS = 10
+
+# Reports with a larger limit are fetched in pages of this many rows, with
+# up to PAGE_WORKERS pages in flight at once
+PAGE_SIZE = 10_000
+PAGE_WORKERS = 3
+
+# Title rows requested per top page, leaving room for paths that have had
+# several titles during the period
+TITLE_VARIANTS = 10
+
+
+def _exact_match(field_name: str, value: str) -> FilterExpression:
+    """Build a filter matching a dimension value exactly."""
+    return FilterExpression(
+        filter=Filter(
+            field_name=field_name,
+            string_filter=Filter.StringFilter(
+                value=value,
+                match_type=Filter.StringFilter.MatchType.EXACT
+            )
+        )
+    )
+
+
+# Constant report filters, built once and shared by every request
+_ORGANIC_FILTER = _exact_match("sessionMedium", "organic")
+_PAID_SEARCH_FILTER = _exact_match("sessionDefaultChannelGroup", "Paid Search")
+_HOMEPAGE_FILTER = _exact_match("pagePath", "/")
+_US_FILTER = _exact_match("country", "United States")
+_SCROLL_FILTER = _exact_match("eventName", "scroll")
+
+
+@dataclass
+class _ReportPlan:
+    """
+    A GA4 report definition plus the post-processing for its result.
+    
+    Splitting the request from the processing lets get_all_metrics send
+    several reports in one batch call and still reuse each method's logic.
+    
+    With totals set, the report asks GA4 for metric totals over all rows
+    (not just those within the limit) and process is called as
+    process(df, totals). Single-row reports set scalar, and process then
+    receives the first row as a dict instead of a DataFrame.
+    """
+    metrics: List[str]
+    process: Callable[..., Any]
+    dimensions: List[str] = None
+    dimension_filter: FilterExpression = None
+    order_bys: List[OrderBy] = None
+    limit: int = None
+    category_dims: Set[str] = None
+    totals: bool = False
+    scalar: bool = False
+
+
+@dataclass
+class _PlanGroup:
+    """
+    One request serving several report plans.
+    
+    members maps each plan's name to the plan and, for plans answered by
+    picking a single row out of the group's result, the (dimension, value)
+    identifying that row.
+    """
+    plan: _ReportPlan
+    members: Dict[str, Tuple[_ReportPlan, Optional[Tuple[str, str]]]] = field(default_factory=dict)
+
+
+def _exact_match_target(expression: FilterExpression) -> Optional[Tuple[str, str]]:
+    """Return (field, value) if a filter is a single exact string match."""
+    if expression is None or 'filter' not in expression:
+        return None
+    string_filter = expression.filter.string_filter
+    if (
+        'string_filter' not in expression.filter
+        or string_filter.match_type != Filter.StringFilter.MatchType.EXACT
+    ):
+        return None
+    return expression.filter.field_name, string_filter.value
+
+
+def _plan_key(plan: _ReportPlan) -> Tuple:
+    """Everything about a plan's request except its metrics."""
+    return (
+        tuple(plan.dimensions or ()),
+        FilterExpression.serialize(plan.dimension_filter) if plan.dimension_filter else None,
+        tuple(OrderBy.serialize(order) for order in plan.order_bys or ()),
+        plan.limit,
+        plan.totals,
+    )
+
+
+def _has_room(group: _PlanGroup, plan: _ReportPlan) -> bool:
+    """Whether a plan's metrics fit into a group's request."""
+    return len(set(group.plan.metrics) | set(plan.metrics)) <= MAX_METRICS
+
+
+def _merge_metrics(group: _PlanGroup, plan: _ReportPlan) -> None:
+    """Add a plan's metrics and categorical dimensions to a group's request."""
+    group.plan.metrics += [m for m in plan.metrics if m not in group.plan.metrics]
+    if plan.category_dims:
+        group.plan.category_dims = (group.plan.category_dims or set()) | plan.category_dims
+
+
+def _coalesce_plans(plans: Dict[str, _ReportPlan]) -> List[_PlanGroup]:
+    """
+    Group report plans so overlapping ones share a request.
+    
+    Plans with the same dimensions, filter, ordering and limit are merged
+    into one request with the union of their metrics. A single-row plan
+    whose filter is an exact match on a dimension that another plan breaks
+    down by (e.g. paid search within the channel report) is answered from
+    that plan's row instead of its own request. A merge that would take a
+    request past MAX_METRICS is skipped, since GA4 rejects such a report
+    (and with it the whole batch it was sent in).
+    """
+    groups: Dict[Tuple, List[_PlanGroup]] = {}
+    lookups = []
+    
+    def add(name: str, plan: _ReportPlan) -> None:
+        candidates = groups.setdefault(_plan_key(plan), [])
+        group = next((group for group in candidates if _has_room(group, plan)), None)
+        if group is None:
+            group = _PlanGroup(plan=replace(plan, metrics=list(plan.metrics)))
+            candidates.append(group)
+        else:
+            _merge_metrics(group, plan)
+        group.members[name] = (plan, None)
+    
+    for name, plan in plans.items():
+        target = _exact_match_target(plan.dimension_filter)
+        if (
+            plan.scalar and target
+            and (plan.dimensions or []) in ([], [target[0]])
+            and any(
+                other.dimensions == [target[0]] and not other.dimension_filter
+                for other in plans.values()
+            )
+        ):
+            lookups.append((name, plan, target))
+            continue
+        add(name, plan)
+    
+    for name, plan, target in lookups:
+        host = next(
+            (
+                group for candidates in groups.values() for group in candidates
+                if group.plan.dimensions == [target[0]]
+                and not group.plan.dimension_filter
+                and _has_room(group, plan)
+            ),
+            None,
+        )
+        if host is None:
+            add(name, plan)
+            continue
+        _merge_metrics(host, plan)
+        host.members[name] = (plan, target)
+    
+    return [group for candidates in groups.values() for group in candidates]
+
+
+@lru_cache(maxsize=128)
+def _dimension(name: str) -> Dimension:
+    """Shared Dimension message; the request copies it on assignment."""
+    return Dimension(name=name)
+
+
+@lru_cache(maxsize=128)
+def _metric(name: str) -> Metric:
+    """Shared Metric message; the request copies it on assignment."""
+    return Metric(name=name)
+
+
+@lru_cache(maxsize=32)
+def _load_credentials(credentials_path: str) -> service_account.Credentials:
+    """Parse a service-account key file once per process."""
+    return service_account.Credentials.from_service_account_file(
+        credentials_path,
+        scopes=['https://www.googleapis.com/auth/analytics.readonly']
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_client(credentials_path: str) -> BetaAnalyticsDataClient:
+    """
+    Create a Data API client for a service-account key file.
+    
+    Cached per path so several GA4Clients sharing credentials reuse one
+    parsed key and one gRPC channel, which is safe to share across threads.
+    """
+    return BetaAnalyticsDataClient(credentials=_load_credentials(credentials_path))
+
+
+def _parse_metric_value(value: str) -> Any:
+    """Parse a single metric string as int or float, keeping it if neither."""
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return value
+
+
+def _parse_metric_column(values: List[str], metric_type: int = None) -> Any:
+    """
+    Parse one metric column into a typed array.
+    
+    The metric type reported in the response header decides the dtype, so
+    the strings are converted straight into an int64/float64 buffer without
+    dtype inference. Columns without a usable type go through pandas'
+    parser, and only columns with non-numeric cells are parsed per cell.
+    """
+    if metric_type == MetricType.TYPE_INTEGER:
+        dtype = np.int64
+    elif metric_type:
+        dtype = np.float64
+    else:
+        dtype = None
+    
+    if dtype is not None:
+        try:
+            return np.array(values, dtype=dtype)
+        except ValueError:
+            pass
+    
+    parsed = pd.to_numeric(pd.Series(values), errors='coerce')
+    if parsed.isna().any():
+        # Mixed column; fall back to per-cell parsing for this metric only
+        return [_parse_metric_value(value) for value in values]
+    return parsed.to_numpy()
+
+
+def _share(values: pd.Series, total: float) -> np.ndarray:
+    """Percentage share of total, rounded to 2 dp, in a single buffer."""
+    out = np.divide(values.to_numpy(dtype=np.float64), total)
+    np.multiply(out, 100, out=out)
+    return np.round(out, 2, out=out)
+
+
+def _percent(rates: pd.Series) -> np.ndarray:
+    """Convert 0-1 rates to percentages rounded to 2 dp, in a single buffer."""
+    out = np.multiply(rates.to_numpy(dtype=np.float64), 100)
+    return np.round(out, 2, out=out)
+
+
+def _response_to_dataframe(
+    response: Any,
+    dimensions: List[str],
+    metrics: List[str],
+    category_dims: Set[str] = None
+) -> pd.DataFrame:
+    """
+    Convert a RunReportResponse into a DataFrame.
+    
+    Columns are built one at a time and each metric column is parsed in
+    bulk. Values that are not numeric are kept as the original strings.
+    Dimensions listed in category_dims (low-cardinality ones such as
+    device or channel) are stored as pandas categoricals.
+    """
+    rows = response.rows
+    if not rows:
+        return pd.DataFrame()
+    
+    metric_types = {header.name: header.type_ for header in response.metric_headers}
+    
+    columns = {}
+    for i, dim in enumerate(dimensions):
+        values = [row.dimension_values[i].value for row in rows]
+        if category_dims and dim in category_dims:
+            values = pd.Categorical(values)
+        columns[dim] = values
+    for i, metric in enumerate(metrics):
+        columns[metric] = _parse_metric_column(
+            [row.metric_values[i].value for row in rows],
+            metric_types.get(metric),
+        )
+    
+    # The columns are freshly built arrays, so the frame can take them as-is
+    return pd.DataFrame(columns, copy=False)
+
+
+def _response_to_row(response: Any, metrics: List[str]) -> Dict[str, Any]:
+    """
+    Read the first row of a RunReportResponse as a metric -> value dict.
+    
+    Used for single-row reports, where building a DataFrame costs more
+    than the parsing itself. Returns an empty dict if there are no rows.
+    """
+    if not response.rows:
+        return {}
+    
+    metric_types = {header.name: header.type_ for header in response.metric_headers}
+    
+    row = {}
+    for metric, cell in zip(metrics, response.rows[0].metric_values):
+        metric_type = metric_types.get(metric)
+        try:
+            if metric_type == MetricType.TYPE_INTEGER:
+                row[metric] = int(cell.value)
+            elif metric_type:
+                row[metric] = float(cell.value)
+            else:
+                row[metric] = _parse_metric_value(cell.value)
+        except ValueError:
+            row[metric] = _parse_metric_value(cell.value)
+    return row
+
+
+def _response_totals(response: Any, metrics: List[str]) -> Dict[str, float]:
+    """Read the MetricAggregation.TOTAL row of a response, if present."""
+    if not response.totals:
+        return {}
+    values = response.totals[0].metric_values
+    return {metric: float(values[i].value) for i, metric in enumerate(metrics)}
 
 
 class GA4Client:
@@ -53,13 +383,54 @@ class GA4Client:
         self.client_name = client_config.name
         self.property_id = f"properties/{client_config.ga4_property_id}"
         
-        # Initialize API client
-        credentials = service_account.Credentials.from_service_account_file(
-            str(client_config.get_credentials_path()),
-            scopes=['https://www.googleapis.com/auth/analytics.readonly']
+        # Initialize API client (shared by clients using the same key file)
+        self._credentials_path = str(client_config.get_credentials_path())
+        self._client = _build_client(self._credentials_path)
+        
+        # The async client's channel belongs to the event loop it is first
+        # used on, so it is created lazily by _get_async_client
+        self._aclient = None
+        
+        # Report settings read on every request
+        settings = get_settings()
+        self._default_limit = settings.default_row_limit
+        self._top_pages_limit = settings.top_pages_limit
+        self._max_workers = settings.api_max_workers
+    
+    def _build_request(
+        self,
+        start_date: str,
+        end_date: str,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        dimension_filter: FilterExpression = None,
+        order_bys: List[OrderBy] = None,
+        limit: int = None,
+        metric_aggregations: List[MetricAggregation] = None,
+    ) -> RunReportRequest:
+        """Build a RunReportRequest for this property."""
+        dimensions = dimensions or []
+        metrics = metrics or []
+        limit = limit or self._default_limit
+        
+        request = RunReportRequest(
+            property=self.property_id,
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=[_dimension(d) for d in dimensions],
+            metrics=[_metric(m) for m in metrics],
+            limit=limit,
         )
-        self._client = BetaAnalyticsDataClient(credentials=credentials)
-        self._settings = get_settings()
+        
+        if dimension_filter:
+            request.dimension_filter = dimension_filter
+        
+        if order_bys:
+            request.order_bys = order_bys
+        
+        if metric_aggregations:
+            request.metric_aggregations = metric_aggregations
+        
+        return request
     
     def _run_report(
         self,
@@ -70,6 +441,8 @@ class GA4Client:
         dimension_filter: FilterExpression = None,
         order_bys: List[OrderBy] = None,
         limit: int = None,
+        category_dims: Set[str] = None,
+        page_size: int = PAGE_SIZE,
     ) -> pd.DataFrame:
         """
         Run a GA4 report and return as DataFrame.
@@ -82,45 +455,242 @@ class GA4Client:
             dimension_filter: Optional filter expression
             order_bys: Optional ordering
             limit: Row limit
+            category_dims: Dimensions to return as categorical columns
+            page_size: Rows per request when limit is larger than this
         
         Returns:
             DataFrame with report data
         """
         dimensions = dimensions or []
         metrics = metrics or []
-        limit = limit or self._settings.default_row_limit
+        limit = limit or self._default_limit
         
-        request = RunReportRequest(
-            property=self.property_id,
-            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-            dimensions=[Dimension(name=d) for d in dimensions],
-            metrics=[Metric(name=m) for m in metrics],
-            limit=limit,
-        )
+        def fetch_page(offset: int, page_limit: int) -> Any:
+            request = self._build_request(
+                start_date, end_date, dimensions, metrics,
+                dimension_filter, order_bys, page_limit
+            )
+            if offset:
+                request.offset = offset
+            return self._client.run_report(request)
         
-        if dimension_filter:
-            request.dimension_filter = dimension_filter
+        if limit <= page_size:
+            return _response_to_dataframe(
+                fetch_page(0, limit), dimensions, metrics, category_dims
+            )
         
-        if order_bys:
-            request.order_bys = order_bys
+        # The first page tells us how many rows there are; the rest are
+        # requested (and parsed) concurrently
+        first = fetch_page(0, page_size)
+        end = min(limit, first.row_count)
+        
+        def fetch_frame(offset: int) -> pd.DataFrame:
+            response = fetch_page(offset, min(page_size, end - offset))
+            return _response_to_dataframe(response, dimensions, metrics)
+        
+        frames = [_response_to_dataframe(first, dimensions, metrics)]
+        offsets = range(page_size, end, page_size)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+                frames.extend(executor.map(fetch_frame, offsets))
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        
+        df = pd.concat(frames, ignore_index=True)
+        for dim in category_dims or ():
+            df[dim] = df[dim].astype('category')
+        return df
+    
+    def _run_report_multi(
+        self,
+        date_ranges: List[Tuple[str, str]],
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        dimension_filter: FilterExpression = None,
+        order_bys: List[OrderBy] = None,
+        limit: int = None,
+        category_dims: Set[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Run one GA4 report over several date ranges (up to 4).
+        
+        Ranges are named range_0, range_1, ... in the order given. GA4 adds
+        a dateRange dimension to the response, which is used to split the
+        rows back into one DataFrame per range.
+        
+        Returns:
+            Dictionary of range name -> DataFrame with report data
+        """
+        request = self._build_request(
+            date_ranges[0][0], date_ranges[0][1], dimensions, metrics,
+            dimension_filter, order_bys, limit
+        )
+        names = [f"range_{i}" for i in range(len(date_ranges))]
+        request.date_ranges = [
+            DateRange(start_date=start, end_date=end, name=name)
+            for name, (start, end) in zip(names, date_ranges)
+        ]
         
         response = self._client.run_report(request)
+        df = _response_to_dataframe(
+            response,
+            [header.name for header in response.dimension_headers],
+            metrics or [],
+            category_dims,
+        )
         
-        # Convert to DataFrame
-        data = []
-        for row in response.rows:
-            row_data = {}
-            for i, dim in enumerate(dimensions):
-                row_data[dim] = row.dimension_values[i].value
-            for i, metric in enumerate(metrics):
-                value = row.metric_values[i].value
-                try:
-                    row_data[metric] = float(value) if '.' in value else int(value)
-                except ValueError:
-                    row_data[metric] = value
-            data.append(row_data)
-        
-        return pd.DataFrame(data)
+        if df.empty:
+            return {name: pd.DataFrame() for name in names}
+        if 'dateRange' not in df.columns:
+            return {names[0]: df}
+        
+        frames = {}
+        for name in names:
+            part = df[df['dateRange'] == name].drop(columns='dateRange')
+            frames[name] = part.reset_index(drop=True) if not part.empty else pd.DataFrame()
+        return frames
+    
+    def _run_reports_batch(self, requests: List[RunReportRequest]) -> List[Any]:
+        """
+        Run several reports with batchRunReports.
+        
+        Requests are sent in chunks of BATCH_SIZE, with the chunks issued
+        concurrently. The RunReportResponse for each request is returned
+        in the same order as requests.
+        """
+        chunks = [
+            requests[i:i + BATCH_SIZE]
+            for i in range(0, len(requests), BATCH_SIZE)
+        ]
+        
+        def run_chunk(chunk: List[RunReportRequest]) -> List[Any]:
+            response = self._client.batch_run_reports(BatchRunReportsRequest(
+                property=self.property_id,
+                requests=chunk,
+            ))
+            return list(response.reports)
+        
+        max_workers = max(1, min(len(chunks), self._max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(run_chunk, chunks)
+            return [report for chunk_reports in results for report in chunk_reports]
+    
+    def _plan_request(
+        self, plan: _ReportPlan, start_date: str, end_date: str
+    ) -> RunReportRequest:
+        """Build the request described by a report plan."""
+        return self._build_request(
+            start_date, end_date,
+            dimensions=plan.dimensions,
+            metrics=plan.metrics,
+            dimension_filter=plan.dimension_filter,
+            order_bys=plan.order_bys,
+            limit=plan.limit,
+            metric_aggregations=[MetricAggregation.TOTAL] if plan.totals else None,
+        )
+    
+    def _get_async_client(self) -> BetaAnalyticsDataAsyncClient:
+        """Create the async Data API client on first use."""
+        if self._aclient is None:
+            self._aclient = BetaAnalyticsDataAsyncClient(
+                credentials=_load_credentials(self._credentials_path)
+            )
+        return self._aclient
+    
+    async def _run_report_async(
+        self,
+        start_date: str,
+        end_date: str,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        dimension_filter: FilterExpression = None,
+        order_bys: List[OrderBy] = None,
+        limit: int = None,
+        category_dims: Set[str] = None,
+    ) -> pd.DataFrame:
+        """Async version of _run_report (single page) using grpc.aio."""
+        request = self._build_request(
+            start_date, end_date, dimensions, metrics,
+            dimension_filter, order_bys, limit
+        )
+        response = await self._get_async_client().run_report(request)
+        return _response_to_dataframe(
+            response, dimensions or [], metrics or [], category_dims
+        )
+    
+    async def _execute_async(
+        self, plan: _ReportPlan, start_date: str, end_date: str
+    ) -> Any:
+        """Async version of _execute."""
+        response = await self._get_async_client().run_report(
+            self._plan_request(plan, start_date, end_date)
+        )
+        return self._finish(plan, response)
+    
+    def _finish(self, plan: _ReportPlan, response: Any) -> Any:
+        """Parse a report plan's response and post-process it."""
+        if plan.scalar:
+            return plan.process(_response_to_row(response, plan.metrics))
+        
+        df = _response_to_dataframe(
+            response, plan.dimensions or [], plan.metrics, plan.category_dims
+        )
+        if plan.totals:
+            return plan.process(df, _response_totals(response, plan.metrics))
+        return plan.process(df)
+    
+    def _finish_group(
+        self, group: _PlanGroup, response: Any
+    ) -> Dict[str, Optional[Callable[[_ReportPlan], Any]]]:
+        """
+        Split a coalesced response into per-plan finishers.
+        
+        Each finisher takes the plan to post-process with (normally the
+        member's own). A row lookup whose row may have been cut off by the
+        group's limit gets None, and must be run on its own.
+        """
+        if len(group.members) == 1:
+            return {name: lambda plan: self._finish(plan, response) for name in group.members}
+        
+        df = _response_to_dataframe(
+            response, group.plan.dimensions or [], group.plan.metrics,
+            group.plan.category_dims
+        )
+        totals = _response_totals(response, group.plan.metrics)
+        
+        def finisher(view: pd.DataFrame) -> Callable[[_ReportPlan], Any]:
+            def finish(plan: _ReportPlan) -> Any:
+                if plan.scalar:
+                    rows = view[plan.metrics].to_dict('records') if not view.empty else []
+                    return plan.process(rows[0] if rows else {})
+                if plan.totals:
+                    return plan.process(view, totals)
+                return plan.process(view)
+            return finish
+        
+        finishers = {}
+        for name, (plan, target) in group.members.items():
+            if df.empty:
+                view = df
+            elif target is None:
+                view = df[(plan.dimensions or []) + plan.metrics]
+            else:
+                dimension, value = target
+                view = df[df[dimension] == value].reset_index(drop=True)
+                if view.empty and response.row_count > len(df):
+                    finishers[name] = None
+                    continue
+            finishers[name] = finisher(view)
+        return finishers
+    
+    def _execute(self, plan: _ReportPlan, start_date: str, end_date: str) -> Any:
+        """Run a single report plan and post-process its result."""
+        response = self._client.run_report(
+            self._plan_request(plan, start_date, end_date)
+        )
+        return self._finish(plan, response)
     
     # =========================================================================
     # TRAFFIC OVERVIEW
@@ -135,8 +705,32 @@ class GA4Client:
             Dict with total_users, new_users, returning_users, sessions,
             pageviews, avg_session_duration, bounce_rate, pages_per_session
         """
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_traffic_overview(), start_date, end_date)
+    
+    def _plan_traffic_overview(self) -> _ReportPlan:
+        def process(row: Dict[str, Any]) -> Dict[str, Any]:
+            if not row:
+                return {}
+            
+            total_users = int(row.get('totalUsers', 0))
+            new_users = int(row.get('newUsers', 0))
+            
+            return {
+                'total_users': total_users,
+                'new_users': new_users,
+                'returning_users': max(0, total_users - new_users),
+                'active_users': int(row.get('activeUsers', 0)),
+                'sessions': int(row.get('sessions', 0)),
+                'pageviews': int(row.get('screenPageViews', 0)),
+                'avg_session_duration': round(row.get('averageSessionDuration', 0), 1),
+                'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
+                'pages_per_session': round(row.get('screenPageViewsPerSession', 0), 2),
+                'engaged_sessions': int(row.get('engagedSessions', 0)),
+                'engagement_rate': round(row.get('engagementRate', 0) * 100, 2),
+                'total_engagement_time': round(row.get('userEngagementDuration', 0), 0),
+            }
+        
+        return _ReportPlan(
             dimensions=[],
             metrics=[
                 'totalUsers',
@@ -150,36 +744,58 @@ class GA4Client:
                 'engagedSessions',
                 'engagementRate',
                 'userEngagementDuration',
-            ]
+            ],
+            scalar=True,
+            process=process,
         )
+    
+    @cached(ttl_hours=24)
+    def get_traffic_overview_compare(
+        self,
+        start_date: str,
+        end_date: str,
+        prev_start_date: str,
+        prev_end_date: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get traffic overview metrics for two periods in one request.
         
-        if df.empty:
-            return {}
-        
-        row = df.iloc[0]
-        total_users = int(row.get('totalUsers', 0))
-        new_users = int(row.get('newUsers', 0))
-        
+        Returns:
+            Dictionary with 'current' and 'previous' overviews, each shaped
+            like get_traffic_overview
+        """
+        plan = self._plan_traffic_overview()
+        frames = self._run_report_multi(
+            [(start_date, end_date), (prev_start_date, prev_end_date)],
+            dimensions=plan.dimensions,
+            metrics=plan.metrics,
+        )
+        rows = {
+            name: df.iloc[0].to_dict() if not df.empty else {}
+            for name, df in frames.items()
+        }
         return {
-            'total_users': total_users,
-            'new_users': new_users,
-            'returning_users': max(0, total_users - new_users),
-            'active_users': int(row.get('activeUsers', 0)),
-            'sessions': int(row.get('sessions', 0)),
-            'pageviews': int(row.get('screenPageViews', 0)),
-            'avg_session_duration': round(row.get('averageSessionDuration', 0), 1),
-            'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
-            'pages_per_session': round(row.get('screenPageViewsPerSession', 0), 2),
-            'engaged_sessions': int(row.get('engagedSessions', 0)),
-            'engagement_rate': round(row.get('engagementRate', 0) * 100, 2),
-            'total_engagement_time': round(row.get('userEngagementDuration', 0), 0),
+            'current': plan.process(rows.get('range_0', {})),
+            'previous': plan.process(rows.get('range_1', {})),
         }
     
     @cached(ttl_hours=24)
     def get_traffic_by_month(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get traffic metrics broken down by month."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_traffic_by_month(), start_date, end_date)
+    
+    def _plan_traffic_by_month(self) -> _ReportPlan:
+        def process(df: pd.DataFrame) -> pd.DataFrame:
+            if not df.empty:
+                df = df.assign(
+                    returning_users=df['totalUsers'] - df['newUsers'],
+                    bounceRate=_percent(df['bounceRate']),
+                    averageSessionDuration=df['averageSessionDuration'].round(1),
+                    engagementRate=_percent(df['engagementRate']),
+                ).sort_values('yearMonth')
+            return df
+        
+        return _ReportPlan(
             dimensions=['yearMonth'],
             metrics=[
                 'totalUsers', 
@@ -190,17 +806,9 @@ class GA4Client:
                 'averageSessionDuration',
                 'engagementRate',
             ],
-            limit=12
+            limit=12,
+            process=process,
         )
-        
-        if not df.empty:
-            df['returning_users'] = df['totalUsers'] - df['newUsers']
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['averageSessionDuration'] = df['averageSessionDuration'].round(1)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
-            df = df.sort_values('yearMonth')
-        
-        return df
     
     @cached(ttl_hours=24)
     def get_traffic_by_week(self, start_date: str, end_date: str) -> pd.DataFrame:
@@ -213,8 +821,9 @@ class GA4Client:
         )
         
         if not df.empty:
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df = df.sort_values('yearWeek')
+            df = df.assign(
+                bounceRate=_percent(df['bounceRate']),
+            ).sort_values('yearWeek')
         
         return df
     
@@ -225,9 +834,23 @@ class GA4Client:
     @cached(ttl_hours=24)
     def get_traffic_by_channel(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get traffic breakdown by channel grouping."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_traffic_by_channel(), start_date, end_date)
+    
+    def _plan_traffic_by_channel(self) -> _ReportPlan:
+        def process(df: pd.DataFrame, totals: Dict[str, float]) -> pd.DataFrame:
+            if not df.empty:
+                total_sessions = totals.get('sessions') or df['sessions'].sum()
+                df = df.assign(
+                    session_share=_share(df['sessions'], total_sessions),
+                    bounceRate=_percent(df['bounceRate']),
+                    engagementRate=_percent(df['engagementRate']),
+                    averageSessionDuration=df['averageSessionDuration'].round(1),
+                )
+            return df
+        
+        return _ReportPlan(
             dimensions=['sessionDefaultChannelGroup'],
+            category_dims={'sessionDefaultChannelGroup'},
             metrics=[
                 'sessions', 
                 'totalUsers', 
@@ -241,25 +864,20 @@ class GA4Client:
                 metric=OrderBy.MetricOrderBy(metric_name='sessions'), 
                 desc=True
             )],
-            limit=15
+            limit=15,
+            totals=True,
+            process=process,
         )
-        
-        if not df.empty:
-            total_sessions = df['sessions'].sum()
-            df['session_share'] = (df['sessions'] / total_sessions * 100).round(2)
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
-            df['averageSessionDuration'] = df['averageSessionDuration'].round(1)
-        
-        return df
     
     @cached(ttl_hours=24)
     def get_traffic_by_source_medium(
         self, start_date: str, end_date: str, limit: int = 20
     ) -> pd.DataFrame:
         """Get traffic by source/medium combination."""
-        return self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_traffic_by_source_medium(limit), start_date, end_date)
+    
+    def _plan_traffic_by_source_medium(self, limit: int = 20) -> _ReportPlan:
+        return _ReportPlan(
             dimensions=['sessionSourceMedium'],
             metrics=[
                 'sessions', 
@@ -272,7 +890,8 @@ class GA4Client:
                 metric=OrderBy.MetricOrderBy(metric_name='sessions'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            process=lambda df: df,
         )
     
     @cached(ttl_hours=24)
@@ -284,21 +903,11 @@ class GA4Client:
         Note: Most keywords show as (not set) due to privacy, 
         but this can still provide some insight.
         """
-        dimension_filter = FilterExpression(
-            filter=Filter(
-                field_name="sessionMedium",
-                string_filter=Filter.StringFilter(
-                    value="organic",
-                    match_type=Filter.StringFilter.MatchType.EXACT
-                )
-            )
-        )
-        
         return self._run_report(
             start_date, end_date,
             dimensions=['sessionManualTerm'],
             metrics=['sessions', 'totalUsers', 'bounceRate'],
-            dimension_filter=dimension_filter,
+            dimension_filter=_ORGANIC_FILTER,
             limit=limit
         )
     
@@ -309,18 +918,32 @@ class GA4Client:
     @cached(ttl_hours=24)
     def get_paid_search_overview(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Get overall paid search performance."""
-        dimension_filter = FilterExpression(
-            filter=Filter(
-                field_name="sessionDefaultChannelGroup",
-                string_filter=Filter.StringFilter(
-                    value="Paid Search",
-                    match_type=Filter.StringFilter.MatchType.EXACT
-                )
-            )
-        )
+        return self._execute(self._plan_paid_search_overview(), start_date, end_date)
+    
+    def _plan_paid_search_overview(self) -> _ReportPlan:
+        def process(row: Dict[str, Any]) -> Dict[str, Any]:
+            if not row:
+                return {
+                    'sessions': 0,
+                    'users': 0,
+                    'new_users': 0,
+                    'bounce_rate': 0,
+                    'avg_session_duration': 0,
+                    'engagement_rate': 0,
+                    'pageviews': 0,
+                }
+            
+            return {
+                'sessions': int(row.get('sessions', 0)),
+                'users': int(row.get('totalUsers', 0)),
+                'new_users': int(row.get('newUsers', 0)),
+                'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
+                'avg_session_duration': round(row.get('averageSessionDuration', 0), 1),
+                'engagement_rate': round(row.get('engagementRate', 0) * 100, 2),
+                'pageviews': int(row.get('screenPageViews', 0)),
+            }
         
-        df = self._run_report(
-            start_date, end_date,
+        return _ReportPlan(
             dimensions=[],
             metrics=[
                 'sessions', 
@@ -331,38 +954,31 @@ class GA4Client:
                 'engagementRate',
                 'screenPageViews',
             ],
-            dimension_filter=dimension_filter
+            dimension_filter=_PAID_SEARCH_FILTER,
+            scalar=True,
+            process=process,
         )
-        
-        if df.empty:
-            return {
-                'sessions': 0,
-                'users': 0,
-                'new_users': 0,
-                'bounce_rate': 0,
-                'avg_session_duration': 0,
-                'engagement_rate': 0,
-                'pageviews': 0,
-            }
-        
-        row = df.iloc[0]
-        return {
-            'sessions': int(row.get('sessions', 0)),
-            'users': int(row.get('totalUsers', 0)),
-            'new_users': int(row.get('newUsers', 0)),
-            'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
-            'avg_session_duration': round(row.get('averageSessionDuration', 0), 1),
-            'engagement_rate': round(row.get('engagementRate', 0) * 100, 2),
-            'pageviews': int(row.get('screenPageViews', 0)),
-        }
     
     @cached(ttl_hours=24)
     def get_campaign_performance(
         self, start_date: str, end_date: str, limit: int = 20
     ) -> pd.DataFrame:
         """Get performance by campaign."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_campaign_performance(limit), start_date, end_date)
+    
+    def _plan_campaign_performance(self, limit: int = 20) -> _ReportPlan:
+        def process(df: pd.DataFrame) -> pd.DataFrame:
+            if not df.empty:
+                # Filter out (not set) if there are other campaigns
+                if len(df) > 1:
+                    df = df[df['sessionCampaignName'] != '(not set)']
+                df = df.assign(
+                    bounceRate=_percent(df['bounceRate']),
+                    engagementRate=_percent(df['engagementRate']),
+                )
+            return df
+        
+        return _ReportPlan(
             dimensions=['sessionCampaignName'],
             metrics=[
                 'sessions', 
@@ -376,17 +992,9 @@ class GA4Client:
                 metric=OrderBy.MetricOrderBy(metric_name='sessions'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            process=process,
         )
-        
-        if not df.empty:
-            # Filter out (not set) if there are other campaigns
-            if len(df) > 1:
-                df = df[df['sessionCampaignName'] != '(not set)']
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
-        
-        return df
     
     # =========================================================================
     # CONTENT PERFORMANCE
@@ -396,12 +1004,33 @@ class GA4Client:
     def get_top_pages(
         self, start_date: str, end_date: str, limit: int = None
     ) -> pd.DataFrame:
-        """Get top pages by pageviews with engagement metrics."""
-        limit = limit or self._settings.top_pages_limit
+        """
+        Get top pages by pageviews with engagement metrics.
         
-        df = self._run_report(
-            start_date, end_date,
-            dimensions=['pagePath', 'pageTitle'],
+        Titles come from a second report filtered to the returned paths,
+        so this makes two sequential run_report calls.
+        """
+        df = self._execute(self._plan_top_pages(limit), start_date, end_date)
+        return self._attach_page_titles(df, start_date, end_date)
+    
+    def _plan_top_pages(self, limit: int = None) -> _ReportPlan:
+        limit = limit or self._top_pages_limit
+        
+        def process(df: pd.DataFrame, totals: Dict[str, float]) -> pd.DataFrame:
+            if not df.empty:
+                total_pageviews = totals.get('screenPageViews') or df['screenPageViews'].sum()
+                df = df.assign(
+                    pct_of_total=_share(df['screenPageViews'], total_pageviews),
+                    bounceRate=_percent(df['bounceRate']),
+                    averageSessionDuration=df['averageSessionDuration'].round(1),
+                    avg_time_formatted=lambda d: format_duration_array(d['averageSessionDuration'].to_numpy()),
+                )
+            return df
+        
+        # Ranked by path alone so title variants don't split a page's rows;
+        # titles are attached afterwards by _attach_page_titles
+        return _ReportPlan(
+            dimensions=['pagePath'],
             metrics=[
                 'screenPageViews', 
                 'averageSessionDuration',
@@ -412,25 +1041,78 @@ class GA4Client:
                 metric=OrderBy.MetricOrderBy(metric_name='screenPageViews'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            totals=True,
+            process=process,
         )
+    
+    def _attach_page_titles(
+        self, df: pd.DataFrame, start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """Add a pageTitle column to a top pages frame."""
+        if df.empty:
+            return df
+        return self._execute(self._plan_page_titles(df), start_date, end_date)
+    
+    def _plan_page_titles(self, pages: pd.DataFrame) -> _ReportPlan:
+        """
+        Plan the title lookup for a top pages frame.
         
-        if not df.empty:
-            total_pageviews = df['screenPageViews'].sum()
-            df['pct_of_total'] = (df['screenPageViews'] / total_pageviews * 100).round(2)
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['averageSessionDuration'] = df['averageSessionDuration'].round(1)
-            df['avg_time_formatted'] = df['averageSessionDuration'].apply(format_duration)
+        Titles are fetched for the listed paths only. Where a path has had
+        several titles, the one with the most pageviews is used. The limit
+        allows TITLE_VARIANTS rows per path so extra titles on some paths
+        don't push other paths out of the response.
+        """
+        def process(titles: pd.DataFrame) -> pd.DataFrame:
+            if titles.empty:
+                page_titles = pd.Series('', index=pages.index)
+            else:
+                title_by_path = titles.drop_duplicates('pagePath').set_index('pagePath')['pageTitle']
+                page_titles = pages['pagePath'].map(title_by_path).fillna('')
+            
+            df = pages.copy()
+            df.insert(1, 'pageTitle', page_titles)
+            return df
         
-        return df
+        return _ReportPlan(
+            dimensions=['pagePath', 'pageTitle'],
+            metrics=['screenPageViews'],
+            dimension_filter=FilterExpression(
+                filter=Filter(
+                    field_name="pagePath",
+                    in_list_filter=Filter.InListFilter(
+                        values=pages['pagePath'].tolist(),
+                        case_sensitive=True
+                    )
+                )
+            ),
+            order_bys=[OrderBy(
+                metric=OrderBy.MetricOrderBy(metric_name='screenPageViews'), 
+                desc=True
+            )],
+            limit=len(pages) * TITLE_VARIANTS,
+            process=process,
+        )
     
     @cached(ttl_hours=24)
     def get_landing_pages(
         self, start_date: str, end_date: str, limit: int = 20
     ) -> pd.DataFrame:
         """Get top landing pages (entry points)."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_landing_pages(limit), start_date, end_date)
+    
+    def _plan_landing_pages(self, limit: int = 20) -> _ReportPlan:
+        def process(df: pd.DataFrame, totals: Dict[str, float]) -> pd.DataFrame:
+            if not df.empty:
+                total_sessions = totals.get('sessions') or df['sessions'].sum()
+                df = df.assign(
+                    pct_of_entries=_share(df['sessions'], total_sessions),
+                    bounceRate=_percent(df['bounceRate']),
+                    engagementRate=_percent(df['engagementRate']),
+                )
+            return df
+        
+        return _ReportPlan(
             dimensions=['landingPage'],
             metrics=[
                 'sessions',
@@ -443,36 +1125,56 @@ class GA4Client:
                 metric=OrderBy.MetricOrderBy(metric_name='sessions'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            totals=True,
+            process=process,
         )
+    
+    @cached(ttl_hours=24)
+    def get_homepage_engagement(
+        self,
+        start_date: str,
+        end_date: str,
+        total_pageviews: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get engagement metrics specifically for homepage.
         
-        if not df.empty:
-            total_sessions = df['sessions'].sum()
-            df['pct_of_entries'] = (df['sessions'] / total_sessions * 100).round(2)
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
+        total_pageviews is the site-wide pageview count used for the share
+        percentage. When omitted it is taken from get_traffic_overview.
+        """
+        if total_pageviews is None:
+            total_pageviews = self.get_traffic_overview(start_date, end_date).get('pageviews', 1)
         
-        return df
+        return self._execute(
+            self._plan_homepage_engagement(total_pageviews), start_date, end_date
+        )
     
-    @cached(ttl_hours=24)
-    def get_homepage_engagement(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        """Get engagement metrics specifically for homepage."""
+    def _plan_homepage_engagement(self, total_pageviews: int = 1) -> _ReportPlan:
         # Build filter for homepage paths
         homepage_paths = self.config.homepage_paths or ["/"]
+        total_pageviews = total_pageviews or 1
         
-        # For simplicity, use exact match on "/"
-        dimension_filter = FilterExpression(
-            filter=Filter(
-                field_name="pagePath",
-                string_filter=Filter.StringFilter(
-                    value="/",
-                    match_type=Filter.StringFilter.MatchType.EXACT
-                )
-            )
-        )
+        def process(row: Dict[str, Any]) -> Dict[str, Any]:
+            if not row:
+                return {
+                    'pageviews': 0,
+                    'pct_of_total': 0,
+                    'avg_time': 0,
+                    'bounce_rate': 0,
+                    'users': 0,
+                }
+            
+            return {
+                'pageviews': int(row.get('screenPageViews', 0)),
+                'pct_of_total': round((row.get('screenPageViews', 0) / total_pageviews) * 100, 2),
+                'avg_time': round(row.get('averageSessionDuration', 0), 1),
+                'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
+                'users': int(row.get('activeUsers', 0)),
+            }
         
-        df = self._run_report(
-            start_date, end_date,
+        # For simplicity, use exact match on "/"
+        return _ReportPlan(
             dimensions=['pagePath'],
             metrics=[
                 'screenPageViews',
@@ -480,34 +1182,10 @@ class GA4Client:
                 'bounceRate',
                 'activeUsers',
             ],
-            dimension_filter=dimension_filter
-        )
-        
-        # Get total pageviews for percentage
-        total_df = self._run_report(
-            start_date, end_date,
-            dimensions=[],
-            metrics=['screenPageViews']
+            dimension_filter=_HOMEPAGE_FILTER,
+            scalar=True,
+            process=process,
         )
-        total_pageviews = total_df.iloc[0]['screenPageViews'] if not total_df.empty else 1
-        
-        if df.empty:
-            return {
-                'pageviews': 0,
-                'pct_of_total': 0,
-                'avg_time': 0,
-                'bounce_rate': 0,
-                'users': 0,
-            }
-        
-        row = df.iloc[0]
-        return {
-            'pageviews': int(row.get('screenPageViews', 0)),
-            'pct_of_total': round((row.get('screenPageViews', 0) / total_pageviews) * 100, 2),
-            'avg_time': round(row.get('averageSessionDuration', 0), 1),
-            'bounce_rate': round(row.get('bounceRate', 0) * 100, 2),
-            'users': int(row.get('activeUsers', 0)),
-        }
     
     # =========================================================================
     # AUDIENCE INSIGHTS
@@ -516,9 +1194,22 @@ class GA4Client:
     @cached(ttl_hours=24)
     def get_device_breakdown(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get user engagement by device category."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_device_breakdown(), start_date, end_date)
+    
+    def _plan_device_breakdown(self) -> _ReportPlan:
+        def process(df: pd.DataFrame, totals: Dict[str, float]) -> pd.DataFrame:
+            if not df.empty:
+                total_users = totals.get('totalUsers') or df['totalUsers'].sum()
+                df = df.assign(
+                    user_share=_share(df['totalUsers'], total_users),
+                    bounceRate=_percent(df['bounceRate']),
+                    engagementRate=_percent(df['engagementRate']),
+                )
+            return df
+        
+        return _ReportPlan(
             dimensions=['deviceCategory'],
+            category_dims={'deviceCategory'},
             metrics=[
                 'totalUsers',
                 'sessions',
@@ -526,56 +1217,48 @@ class GA4Client:
                 'averageSessionDuration',
                 'bounceRate',
                 'engagementRate',
-            ]
+            ],
+            totals=True,
+            process=process,
         )
-        
-        if not df.empty:
-            total_users = df['totalUsers'].sum()
-            df['user_share'] = (df['totalUsers'] / total_users * 100).round(2)
-            df['bounceRate'] = (df['bounceRate'] * 100).round(2)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
-        
-        return df
     
     @cached(ttl_hours=24)
     def get_geography(self, start_date: str, end_date: str, limit: int = 20) -> pd.DataFrame:
         """Get traffic by country."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_geography(limit), start_date, end_date)
+    
+    def _plan_geography(self, limit: int = 20) -> _ReportPlan:
+        def process(df: pd.DataFrame, totals: Dict[str, float]) -> pd.DataFrame:
+            if not df.empty:
+                total_users = totals.get('totalUsers') or df['totalUsers'].sum()
+                df = df.assign(
+                    user_share=_share(df['totalUsers'], total_users),
+                    engagementRate=_percent(df['engagementRate']),
+                )
+            return df
+        
+        return _ReportPlan(
             dimensions=['country'],
+            category_dims={'country'},
             metrics=['totalUsers', 'sessions', 'engagementRate'],
             order_bys=[OrderBy(
                 metric=OrderBy.MetricOrderBy(metric_name='totalUsers'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            totals=True,
+            process=process,
         )
-        
-        if not df.empty:
-            total_users = df['totalUsers'].sum()
-            df['user_share'] = (df['totalUsers'] / total_users * 100).round(2)
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
-        
-        return df
     
     @cached(ttl_hours=24)
     def get_us_states(self, start_date: str, end_date: str, limit: int = 15) -> pd.DataFrame:
         """Get traffic by US state (for US-focused nonprofits)."""
-        dimension_filter = FilterExpression(
-            filter=Filter(
-                field_name="country",
-                string_filter=Filter.StringFilter(
-                    value="United States",
-                    match_type=Filter.StringFilter.MatchType.EXACT
-                )
-            )
-        )
-        
         df = self._run_report(
             start_date, end_date,
             dimensions=['region'],
+            category_dims={'region'},
             metrics=['totalUsers', 'sessions', 'engagementRate'],
-            dimension_filter=dimension_filter,
+            dimension_filter=_US_FILTER,
             order_bys=[OrderBy(
                 metric=OrderBy.MetricOrderBy(metric_name='totalUsers'), 
                 desc=True
@@ -584,42 +1267,57 @@ class GA4Client:
         )
         
         if not df.empty:
-            df['engagementRate'] = (df['engagementRate'] * 100).round(2)
+            df = df.assign(engagementRate=_percent(df['engagementRate']))
         
         return df
     
     @cached(ttl_hours=24)
     def get_new_vs_returning(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Get new vs returning user breakdown."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_new_vs_returning(), start_date, end_date)
+    
+    def _plan_new_vs_returning(self) -> _ReportPlan:
+        def process(df: pd.DataFrame) -> Dict[str, Any]:
+            user_types = ('new', 'returning')
+            if df.empty:
+                return {user_type: {} for user_type in user_types}
+            
+            df = df.assign(
+                newVsReturning=df['newVsReturning'].str.lower(),
+                pct_of_total=_share(df['totalUsers'], df['totalUsers'].sum()),
+                bounce_rate=_percent(df['bounceRate']),
+                avg_session_duration=df['averageSessionDuration'].round(1),
+                pages_per_session=df['screenPageViewsPerSession'].round(2),
+            )
+            raw = (
+                df[df['newVsReturning'].isin(user_types)]
+                .set_index('newVsReturning')
+                [[
+                    'totalUsers',
+                    'pct_of_total',
+                    'sessions',
+                    'bounce_rate',
+                    'avg_session_duration',
+                    'pages_per_session',
+                ]]
+                .rename(columns={'totalUsers': 'users'})
+                .to_dict('index')
+            )
+            
+            return {user_type: raw.get(user_type, {}) for user_type in user_types}
+        
+        return _ReportPlan(
             dimensions=['newVsReturning'],
+            category_dims={'newVsReturning'},
             metrics=[
                 'totalUsers',
                 'sessions',
                 'bounceRate',
                 'averageSessionDuration',
                 'screenPageViewsPerSession',
-            ]
+            ],
+            process=process,
         )
-        
-        result = {'new': {}, 'returning': {}}
-        
-        if not df.empty:
-            total_users = df['totalUsers'].sum()
-            for _, row in df.iterrows():
-                user_type = row['newVsReturning'].lower()
-                if user_type in result:
-                    result[user_type] = {
-                        'users': int(row['totalUsers']),
-                        'pct_of_total': round(row['totalUsers'] / total_users * 100, 2),
-                        'sessions': int(row['sessions']),
-                        'bounce_rate': round(row['bounceRate'] * 100, 2),
-                        'avg_session_duration': round(row['averageSessionDuration'], 1),
-                        'pages_per_session': round(row['screenPageViewsPerSession'], 2),
-                    }
-        
-        return result
     
     # =========================================================================
     # EVENTS & CONVERSIONS
@@ -628,67 +1326,133 @@ class GA4Client:
     @cached(ttl_hours=24)
     def get_top_events(self, start_date: str, end_date: str, limit: int = 20) -> pd.DataFrame:
         """Get top events by count."""
-        df = self._run_report(
-            start_date, end_date,
+        return self._execute(self._plan_top_events(limit), start_date, end_date)
+    
+    def _plan_top_events(self, limit: int = 20) -> _ReportPlan:
+        def process(df: pd.DataFrame) -> pd.DataFrame:
+            # Filter out standard GA4 events if desired
+            standard_events = ['page_view', 'session_start', 'first_visit', 'user_engagement']
+            if not df.empty and len(df) > len(standard_events):
+                df['is_custom'] = ~df['eventName'].isin(standard_events)
+            return df
+        
+        return _ReportPlan(
             dimensions=['eventName'],
             metrics=['eventCount', 'totalUsers'],
             order_bys=[OrderBy(
                 metric=OrderBy.MetricOrderBy(metric_name='eventCount'), 
                 desc=True
             )],
-            limit=limit
+            limit=limit,
+            process=process,
         )
-        
-        # Filter out standard GA4 events if desired
-        standard_events = ['page_view', 'session_start', 'first_visit', 'user_engagement']
-        if not df.empty and len(df) > len(standard_events):
-            df['is_custom'] = ~df['eventName'].isin(standard_events)
-        
-        return df
     
     @cached(ttl_hours=24)
     def get_scroll_depth(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get scroll depth data (if scroll tracking is enabled)."""
-        dimension_filter = FilterExpression(
-            filter=Filter(
-                field_name="eventName",
-                string_filter=Filter.StringFilter(
-                    value="scroll",
-                    match_type=Filter.StringFilter.MatchType.EXACT
-                )
-            )
-        )
-        
         return self._run_report(
             start_date, end_date,
             dimensions=['percentScrolled'],
             metrics=['eventCount'],
-            dimension_filter=dimension_filter
+            dimension_filter=_SCROLL_FILTER
         )
     
     # =========================================================================
     # CONVENIENCE METHODS
     # =========================================================================
     
+    @cached(ttl_hours=24)
     def get_all_metrics(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """
         Get all metrics in a single call for comprehensive reporting.
         
         Returns a dictionary with all data categories.
+        
+        Reports are sent through batchRunReports, BATCH_SIZE per call, with
+        the batches issued concurrently. Overlapping reports are coalesced
+        into shared requests first (see _coalesce_plans). Page titles need
+        the top pages' paths, so they are one more run_report call after
+        the batches.
+        """
+        plans = self._all_metrics_plans()
+        # Homepage engagement rides along; its share of total pageviews is
+        # filled in from the traffic overview afterwards
+        plans['homepage_engagement'] = self._plan_homepage_engagement()
+        
+        groups = _coalesce_plans(plans)
+        reports = self._run_reports_batch([
+            self._plan_request(group.plan, start_date, end_date)
+            for group in groups
+        ])
+        
+        finishers = {}
+        for group, report in zip(groups, reports):
+            finishers.update(self._finish_group(group, report))
+        
+        def finish(name: str, plan: _ReportPlan) -> Any:
+            if finishers[name] is None:
+                return self._execute(plan, start_date, end_date)
+            return finishers[name](plan)
+        
+        homepage = plans.pop('homepage_engagement')
+        results = {name: finish(name, plan) for name, plan in plans.items()}
+        
+        total_pageviews = results['traffic_overview'].get('pageviews', 1)
+        results['homepage_engagement'] = finish(
+            'homepage_engagement',
+            self._plan_homepage_engagement(total_pageviews),
+        )
+        results['top_pages'] = self._attach_page_titles(
+            results['top_pages'], start_date, end_date
+        )
+        
+        return results
+    
+    async def get_all_metrics_async(
+        self, start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """
+        Async version of get_all_metrics.
+        
+        Each report is its own run_report call on the grpc.aio client, so
+        callers running an event loop can gather this across many clients.
+        Results are not read from or written to the disk cache.
         """
+        plans = self._all_metrics_plans()
+        names = list(plans)
+        
+        frames = await asyncio.gather(
+            *(self._execute_async(plan, start_date, end_date) for plan in plans.values()),
+            self._get_async_client().run_report(
+                self._plan_request(self._plan_homepage_engagement(), start_date, end_date)
+            ),
+        )
+        
+        results = dict(zip(names, frames))
+        total_pageviews = results['traffic_overview'].get('pageviews', 1)
+        results['homepage_engagement'] = self._finish(
+            self._plan_homepage_engagement(total_pageviews), frames[-1]
+        )
+        if not results['top_pages'].empty:
+            results['top_pages'] = await self._execute_async(
+                self._plan_page_titles(results['top_pages']), start_date, end_date
+            )
+        
+        return results
+    
+    def _all_metrics_plans(self) -> Dict[str, _ReportPlan]:
+        """Report plans fetched by get_all_metrics, keyed by result name."""
         return {
-            'traffic_overview': self.get_traffic_overview(start_date, end_date),
-            'traffic_by_month': self.get_traffic_by_month(start_date, end_date),
-            'traffic_by_channel': self.get_traffic_by_channel(start_date, end_date),
-            'traffic_by_source': self.get_traffic_by_source_medium(start_date, end_date),
-            'top_pages': self.get_top_pages(start_date, end_date),
-            'landing_pages': self.get_landing_pages(start_date, end_date),
-            'homepage_engagement': self.get_homepage_engagement(start_date, end_date),
-            'device_breakdown': self.get_device_breakdown(start_date, end_date),
-            'geography': self.get_geography(start_date, end_date),
-            'new_vs_returning': self.get_new_vs_returning(start_date, end_date),
-            'paid_search': self.get_paid_search_overview(start_date, end_date),
-            'campaigns': self.get_campaign_performance(start_date, end_date),
-            'top_events': self.get_top_events(start_date, end_date),
+            'traffic_overview': self._plan_traffic_overview(),
+            'traffic_by_month': self._plan_traffic_by_month(),
+            'traffic_by_channel': self._plan_traffic_by_channel(),
+            'traffic_by_source': self._plan_traffic_by_source_medium(),
+            'top_pages': self._plan_top_pages(),
+            'landing_pages': self._plan_landing_pages(),
+            'device_breakdown': self._plan_device_breakdown(),
+            'geography': self._plan_geography(),
+            'new_vs_returning': self._plan_new_vs_returning(),
+            'paid_search': self._plan_paid_search_overview(),
+            'campaigns': self._plan_campaign_performance(),
+            'top_events': self._plan_top_events(),
         }
-
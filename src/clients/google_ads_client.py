@@ -17,13 +17,34 @@ if the accounts are linked.
 
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
 import requests
 
 from config.settings import ClientConfig, get_settings
 from src.utils.cache import cached
 
 
+# Google Ad Grants budget: $10,000/month, spread over an average month
+_MONTHLY_GRANT = 10000
+_DAILY_GRANT = _MONTHLY_GRANT / 30.4
+
+# GA4 campaign report columns -> keys of the campaign dicts we return
+_GA4_CAMPAIGN_FIELDS = {
+    "sessionCampaignName": "name",
+    "sessions": "sessions",
+    "totalUsers": "users",
+    "newUsers": "new_users",
+    "bounceRate": "bounce_rate",
+    "engagementRate": "engagement_rate",
+}
+_GA4_COUNT_COLUMNS = ["sessions", "totalUsers", "newUsers"]
+_GA4_RATE_COLUMNS = ["bounceRate", "engagementRate"]
+_GA4_CAMPAIGN_DEFAULTS = {
+    "sessionCampaignName": "Unknown",
+    **dict.fromkeys(_GA4_COUNT_COLUMNS + _GA4_RATE_COLUMNS, 0),
+}
+
+
 @dataclass
 class CampaignMetrics:
     """Metrics for a single campaign."""
@@ -111,7 +132,7 @@ class GoogleAdsClient:
         
         Tries direct API first, falls back to GA4 data if available.
         """
-        # Try direct Google Ads API
+        # Try direct Google Ads API (skipped entirely when not configured)
         if self.is_configured:
             result = self._fetch_from_ads_api(start_date, end_date)
             if result.get("available"):
@@ -137,25 +158,20 @@ class GoogleAdsClient:
         Note: Full implementation requires google-ads library and OAuth setup.
         This is a simplified placeholder that shows the structure.
         """
-        try:
-            # This would require the google-ads library and proper auth
-            # For now, return unavailable and let GA4 fallback handle it
-            
-            # Full implementation would be:
-            # from google.ads.googleads.client import GoogleAdsClient
-            # client = GoogleAdsClient.load_from_storage()
-            # ... query campaigns ...
-            
-            return {
-                "available": False,
-                "reason": "Direct Google Ads API not implemented - using GA4 fallback"
-            }
-            
-        except Exception as e:
-            return {
-                "available": False,
-                "reason": f"Google Ads API error: {str(e)}"
-            }
+        # This would require the google-ads library and proper auth
+        # For now, return unavailable and let GA4 fallback handle it
+        
+        # Full implementation would be:
+        # from google.ads.googleads.client import GoogleAdsClient
+        # client = GoogleAdsClient.load_from_storage()
+        # ... query campaigns; loading with use_proto_plus: False gives raw
+        # protobuf rows, which are much faster to iterate over for large
+        # campaign/ad group result sets ...
+        
+        return {
+            "available": False,
+            "reason": "Direct Google Ads API not implemented - using GA4 fallback"
+        }
     
     def _fetch_from_ga4(
         self,
@@ -184,15 +200,11 @@ class GoogleAdsClient:
             
             campaigns = []
             if campaigns_df is not None and not campaigns_df.empty:
-                for _, row in campaigns_df.iterrows():
-                    campaigns.append({
-                        "name": row.get("sessionCampaignName", "Unknown"),
-                        "sessions": int(row.get("sessions", 0)),
-                        "users": int(row.get("totalUsers", 0)),
-                        "new_users": int(row.get("newUsers", 0)),
-                        "bounce_rate": round(row.get("bounceRate", 0), 2),
-                        "engagement_rate": round(row.get("engagementRate", 0), 2),
-                    })
+                sub = campaigns_df.reindex(columns=list(_GA4_CAMPAIGN_FIELDS))
+                sub = sub.fillna(_GA4_CAMPAIGN_DEFAULTS)
+                sub[_GA4_COUNT_COLUMNS] = sub[_GA4_COUNT_COLUMNS].astype("int32")
+                sub[_GA4_RATE_COLUMNS] = sub[_GA4_RATE_COLUMNS].round(2)
+                campaigns = sub.rename(columns=_GA4_CAMPAIGN_FIELDS).to_dict(orient="records")
             
             return {
                 "available": True,
@@ -230,17 +242,10 @@ class GoogleAdsClient:
         if not data.get("available"):
             return data
         
-        # Ad Grants specifics
-        monthly_grant = 10000
-        daily_grant = monthly_grant / 30.4
-        
         # Calculate date range days
-        from datetime import datetime
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        days = (end - start).days + 1
+        days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
         
-        total_budget_available = daily_grant * days
+        total_budget_available = _DAILY_GRANT * days
         
         # Note: Without direct Ads API, we can't get actual spend
         # We can only report on what GA4 shows
@@ -248,8 +253,8 @@ class GoogleAdsClient:
         return {
             "available": True,
             "grant_info": {
-                "monthly_budget": monthly_grant,
-                "daily_budget": round(daily_grant, 2),
+                "monthly_budget": _MONTHLY_GRANT,
+                "daily_budget": round(_DAILY_GRANT, 2),
                 "period_days": days,
                 "period_budget_available": round(total_budget_available, 2),
             },
@@ -266,7 +271,8 @@ class GoogleAdsClient:
         """
         Get all available Google Ads data for quarterly reports.
         """
-        print("    💰 Fetching Google Ads data...")
+        if self._settings.verbose:
+            print("    💰 Fetching Google Ads data...")
         
         performance = self.get_campaign_performance(start_date, end_date)
         
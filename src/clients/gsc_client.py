@@ -12,13 +12,177 @@ This client provides access to all key SEO metrics:
 """
 
 from typing import Optional, Dict, List, Any
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+import json
+import threading
+import numpy as np
 import pandas as pd
 
+import httplib2
+import google_auth_httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
 from config.settings import ClientConfig, get_settings
-from src.utils.cache import cached
+from src.utils.cache import cached, single_flight
+
+
+# Client-side timeout (seconds), matching the server's own deadline, so a
+# stalled request fails instead of hanging its worker
+REQUEST_TIMEOUT = 60
+
+# Partial response: only the row data is parsed, so only rows are requested
+ROW_FIELDS = 'rows(keys,clicks,impressions,ctr,position)'
+
+# Most rows the API returns per request; larger row limits are paged
+PAGE_SIZE = 25_000
+
+# Responses fetched ahead of time by _prefetch, keyed by request body. Set
+# only for the duration of a get_all_metrics call, so concurrent calls on
+# the same client never see (or clear) each other's responses.
+_PREFETCHED: ContextVar[Dict[str, Dict[str, Any]]] = ContextVar('gsc_prefetched', default={})
+
+
+@lru_cache(maxsize=32)
+def _load_credentials(credentials_path: str) -> service_account.Credentials:
+    """Parse a service-account key file once per process."""
+    return service_account.Credentials.from_service_account_file(
+        credentials_path,
+        scopes=['https://www.googleapis.com/auth/webmasters.readonly']
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_service(credentials_path: str) -> Any:
+    """
+    Create a Search Console service for a service-account key file.
+    
+    Cached per path so several clients sharing credentials reuse one
+    parsed key and one service. The discovery document bundled with
+    googleapiclient is used, so building needs no network round trip.
+    Requests are always executed on a per-thread Http (see _http), so
+    sharing the service across threads is safe.
+    """
+    return build(
+        'searchconsole', 'v1',
+        credentials=_load_credentials(credentials_path),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def _opportunity_scores(
+    impressions: np.ndarray, ctr: np.ndarray, position: np.ndarray
+) -> tuple:
+    """
+    Flag keyword opportunities and score them by impression potential.
+    
+    Opportunities have high impressions, low CTR and a position between
+    5 and 20 (pages 1-2). Returns (mask, score) over all rows.
+    """
+    mask = (impressions >= 50) & (ctr < 3.0) & (position >= 5) & (position <= 20)
+    score = impressions * (10 - position) / 10
+    return mask, score
+
+
+@dataclass
+class QueryResult:
+    """
+    Search analytics rows, stored as one array per column.
+    
+    Internal calculations work on the arrays directly; methods that
+    return a DataFrame call to_dataframe() at the end.
+    """
+    dims: Dict[str, np.ndarray]
+    clicks: np.ndarray
+    impressions: np.ndarray
+    ctr: np.ndarray
+    position: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.clicks)
+    
+    @property
+    def empty(self) -> bool:
+        return len(self.clicks) == 0
+    
+    def take(self, index: Any) -> 'QueryResult':
+        """Select rows by slice, boolean mask or positions."""
+        return QueryResult(
+            dims={dim: values[index] for dim, values in self.dims.items()},
+            clicks=self.clicks[index],
+            impressions=self.impressions[index],
+            ctr=self.ctr[index],
+            position=self.position[index],
+        )
+    
+    def head(self, n: int) -> 'QueryResult':
+        return self.take(slice(0, n))
+    
+    @classmethod
+    def concat(cls, results: List['QueryResult']) -> 'QueryResult':
+        """Join pages of the same query, in order."""
+        first = results[0]
+        return cls(
+            dims={
+                dim: np.concatenate([result.dims[dim] for result in results])
+                for dim in first.dims
+            },
+            clicks=np.concatenate([result.clicks for result in results]),
+            impressions=np.concatenate([result.impressions for result in results]),
+            ctr=np.concatenate([result.ctr for result in results]),
+            position=np.concatenate([result.position for result in results]),
+        )
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Wrap the arrays in a DataFrame without copying them.
+        
+        The columns keep the parsed dtypes, so nothing is re-inferred.
+        The frame shares memory with this result.
+        """
+        if self.empty:
+            return pd.DataFrame()
+        return pd.DataFrame({
+            **self.dims,
+            'clicks': self.clicks,
+            'impressions': self.impressions,
+            'ctr': self.ctr,
+            'position': self.position,
+        }, copy=False)
+
+
+def _parse_rows(rows: List[Dict[str, Any]], dimensions: List[str]) -> QueryResult:
+    """
+    Convert searchanalytics.query rows into a QueryResult.
+    
+    A few passes over the row list; about 10 ms for 25k rows, far less
+    than the request itself.
+    """
+    n = len(rows)
+    
+    dims = {}
+    for i, dim in enumerate(dimensions):
+        values = np.empty(n, dtype=object)
+        values[:] = [row['keys'][i] for row in rows]
+        dims[dim] = values
+    
+    # 32-bit counts halve the memory each sort and filter has to scan;
+    # aggregates are accumulated in 64 bits. ctr and position stay float64,
+    # since float32 can't hold rounded values like 1.2 exactly.
+    ctr = np.fromiter((row['ctr'] for row in rows), dtype=np.float64, count=n)
+    position = np.fromiter((row['position'] for row in rows), dtype=np.float64, count=n)
+    
+    return QueryResult(
+        dims=dims,
+        clicks=np.fromiter((row['clicks'] for row in rows), dtype=np.int32, count=n),
+        impressions=np.fromiter((row['impressions'] for row in rows), dtype=np.int32, count=n),
+        ctr=np.round(ctr * 100, 2),  # Convert to percentage
+        position=np.round(position, 1),
+    )
 
 
 class SearchConsoleClient:
@@ -41,13 +205,99 @@ class SearchConsoleClient:
         self.site_url = client_config.gsc_site_url
         
         # Initialize API client
-        credentials = service_account.Credentials.from_service_account_file(
-            str(client_config.get_credentials_path()),
-            scopes=['https://www.googleapis.com/auth/webmasters.readonly']
-        )
-        self._service = build('searchconsole', 'v1', credentials=credentials)
+        credentials_path = str(client_config.get_credentials_path())
+        self._service = _build_service(credentials_path)
         self._settings = get_settings()
+        
+        # httplib2 connections are not thread-safe, so each thread that
+        # executes requests gets its own authorized Http
+        self._credentials = _load_credentials(credentials_path)
+        self._local = threading.local()
+    
+    def _execute(self, request: Any) -> Dict[str, Any]:
+        """
+        Execute an API request on this thread's HTTP connection.
+        
+        Reads are idempotent, so rate limits (429), server errors (5xx)
+        and socket errors are retried with exponential backoff.
+        """
+        return request.execute(
+            http=self._http(),
+            num_retries=self._settings.api_retry_count
+        )
+    
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """This thread's authorized HTTP connection."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(
+                self._credentials, http=httplib2.Http(timeout=REQUEST_TIMEOUT)
+            )
+        return http
+    
+    def _query_body(
+        self,
+        start_date: str,
+        end_date: str,
+        dimensions: List[str] = None,
+        row_limit: int = None,
+        dimension_filter: Dict = None,
+        data_state: str = 'final',
+    ) -> Dict[str, Any]:
+        """Build a searchanalytics.query request body (see _run_query)."""
+        request_body = {
+            'startDate': start_date,
+            'endDate': end_date,
+            'dimensions': dimensions or ['query'],
+            'rowLimit': row_limit or self._settings.default_row_limit,
+            'dataState': data_state,
+        }
+        
+        if dimension_filter:
+            request_body['dimensionFilterGroups'] = [dimension_filter]
+        
+        return request_body
     
+    def _query(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a searchanalytics.query, using a prefetched response if any."""
+        response = _PREFETCHED.get().get(json.dumps(request_body, sort_keys=True))
+        if response is not None:
+            return response
+        return self._execute(self._service.searchanalytics().query(
+            siteUrl=self.site_url,
+            body=request_body,
+            fields=ROW_FIELDS
+        ))
+    
+    def _prefetch(self, request_bodies: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several queries in one batch HTTP request.
+        
+        Returns the responses keyed by request body, for _query to pick up
+        once they are set in _PREFETCHED. A query that fails within the
+        batch is simply left out, and is retried on its own later.
+        """
+        prefetched = {}
+        
+        def store(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+            if exception is None:
+                prefetched[request_id] = response
+        
+        batch = self._service.new_batch_http_request(callback=store)
+        for request_body in request_bodies:
+            batch.add(
+                self._service.searchanalytics().query(
+                    siteUrl=self.site_url,
+                    body=request_body,
+                    fields=ROW_FIELDS
+                ),
+                request_id=json.dumps(request_body, sort_keys=True),
+            )
+        batch.execute(http=self._http())
+        return prefetched
+    
+    @cached(ttl_hours=24)
+    @single_flight
     def _run_query(
         self,
         start_date: str,
@@ -56,9 +306,9 @@ class SearchConsoleClient:
         row_limit: int = None,
         dimension_filter: Dict = None,
         data_state: str = 'final',
-    ) -> pd.DataFrame:
+    ) -> QueryResult:
         """
-        Run a Search Console query and return as DataFrame.
+        Run a Search Console query and return its columns.
         
         Args:
             start_date: Start date (YYYY-MM-DD)
@@ -69,67 +319,71 @@ class SearchConsoleClient:
             data_state: 'final' or 'all' (includes fresh data)
         
         Returns:
-            DataFrame with search analytics data
-        """
-        dimensions = dimensions or ['query']
-        row_limit = row_limit or self._settings.default_row_limit
-        
-        request_body = {
-            'startDate': start_date,
-            'endDate': end_date,
-            'dimensions': dimensions,
-            'rowLimit': row_limit,
-            'dataState': data_state,
-        }
+            QueryResult with search analytics data
         
-        if dimension_filter:
-            request_body['dimensionFilterGroups'] = [dimension_filter]
+        Results are cached by the request parameters, so methods that
+        issue the same query share one cache entry.
         
-        response = self._service.searchanalytics().query(
-            siteUrl=self.site_url,
-            body=request_body
-        ).execute()
-        
-        rows = response.get('rows', [])
-        
-        if not rows:
-            return pd.DataFrame()
+        Row limits above PAGE_SIZE are fetched page by page with startRow,
+        parsing each page as it arrives, until a short page or the limit.
+        """
+        request_body = self._query_body(
+            start_date, end_date, dimensions, row_limit,
+            dimension_filter, data_state
+        )
+        dimensions = request_body['dimensions']
+        row_limit = request_body['rowLimit']
         
-        data = []
-        for row in rows:
-            row_data = {}
-            for i, dim in enumerate(dimensions):
-                row_data[dim] = row['keys'][i]
-            row_data['clicks'] = row['clicks']
-            row_data['impressions'] = row['impressions']
-            row_data['ctr'] = round(row['ctr'] * 100, 2)  # Convert to percentage
-            row_data['position'] = round(row['position'], 1)
-            data.append(row_data)
+        pages = []
+        start_row = 0
+        while True:
+            page_size = min(PAGE_SIZE, row_limit - start_row)
+            page_body = dict(request_body, rowLimit=page_size)
+            if start_row:
+                page_body['startRow'] = start_row
+            
+            rows = self._query(page_body).get('rows', [])
+            pages.append(_parse_rows(rows, dimensions))
+            start_row += len(rows)
+            
+            if len(rows) < page_size or start_row >= row_limit:
+                break
         
-        return pd.DataFrame(data)
+        return pages[0] if len(pages) == 1 else QueryResult.concat(pages)
     
     # =========================================================================
     # KEYWORD ANALYSIS
     # =========================================================================
     
-    @cached(ttl_hours=24)
+    def _get_query_dataset(
+        self, start_date: str, end_date: str, row_limit: int = 1000
+    ) -> QueryResult:
+        """
+        Get the top queries by clicks, shared by the keyword methods.
+        
+        The first caller fetches the data and later (or concurrent) callers
+        get it from the _run_query cache. Search Console returns rows ordered
+        by clicks, so head(n) of this result is the same as a query with
+        row_limit=n.
+        """
+        return self._run_query(start_date, end_date, ['query'], row_limit=row_limit)
+    
     def get_top_keywords_by_clicks(
         self, start_date: str, end_date: str, limit: int = None
     ) -> pd.DataFrame:
         """Get top keywords sorted by clicks."""
         limit = limit or self._settings.top_keywords_limit
-        df = self._run_query(start_date, end_date, ['query'], row_limit=limit)
+        df = self._run_query(start_date, end_date, ['query'], row_limit=limit).to_dataframe()
         if not df.empty:
             df = df.sort_values('clicks', ascending=False).head(limit)
         return df
     
-    @cached(ttl_hours=24)
     def get_top_keywords_by_impressions(
         self, start_date: str, end_date: str, limit: int = None
     ) -> pd.DataFrame:
         """Get top keywords sorted by impressions."""
         limit = limit or self._settings.top_keywords_limit
-        df = self._run_query(start_date, end_date, ['query'], row_limit=limit)
+        df = self._run_query(start_date, end_date, ['query'], row_limit=limit).to_dataframe()
         if not df.empty:
             df = df.sort_values('impressions', ascending=False).head(limit)
         return df
@@ -144,9 +398,9 @@ class SearchConsoleClient:
         Args:
             min_impressions: Minimum impressions to filter noise
         """
-        df = self._run_query(start_date, end_date, ['query'], row_limit=500)
+        result = self._get_query_dataset(start_date, end_date).head(500)
+        df = result.take(result.impressions >= min_impressions).to_dataframe()
         if not df.empty:
-            df = df[df['impressions'] >= min_impressions]
             df = df.sort_values('ctr', ascending=False).head(limit)
         return df
     
@@ -159,17 +413,11 @@ class SearchConsoleClient:
         These are keywords where you're showing but not getting clicks.
         Good candidates for optimization.
         """
-        df = self._run_query(start_date, end_date, ['query'], row_limit=500)
+        result = self._get_query_dataset(start_date, end_date).head(500)
+        mask, score = _opportunity_scores(result.impressions, result.ctr, result.position)
+        df = result.take(mask).to_dataframe()
         if not df.empty:
-            # High impressions, low CTR, position between 5-20 (page 1-2)
-            df = df[
-                (df['impressions'] >= 50) & 
-                (df['ctr'] < 3.0) & 
-                (df['position'] >= 5) & 
-                (df['position'] <= 20)
-            ]
-            # Score by impression potential
-            df['opportunity_score'] = df['impressions'] * (10 - df['position']) / 10
+            df['opportunity_score'] = score[mask]
             df = df.sort_values('opportunity_score', ascending=False).head(limit)
         return df
     
@@ -188,33 +436,39 @@ class SearchConsoleClient:
             # Extract likely brand terms from site URL
             brand_terms = ['bee conservancy', 'thebeeconservancy', 'bee', 'conservancy']
         
-        df = self._run_query(start_date, end_date, ['query'], row_limit=1000)
+        result = self._get_query_dataset(start_date, end_date)
         
-        if df.empty:
+        if result.empty:
             return {'branded': {}, 'non_branded': {}}
         
         # Identify branded queries
-        brand_pattern = '|'.join(brand_terms)
-        df['is_branded'] = df['query'].str.lower().str.contains(brand_pattern, na=False)
+        brand_pattern = re.compile('|'.join(map(re.escape, brand_terms)), re.IGNORECASE)
+        is_branded = np.fromiter(
+            (brand_pattern.search(query) is not None for query in result.dims['query']),
+            dtype=bool, count=len(result)
+        )
         
-        branded = df[df['is_branded']]
-        non_branded = df[~df['is_branded']]
+        def segment(mask: np.ndarray) -> Dict[str, Any]:
+            queries = int(mask.sum())
+            if not queries:
+                return {
+                    'queries': 0,
+                    'clicks': 0,
+                    'impressions': 0,
+                    'avg_ctr': 0,
+                    'avg_position': 0,
+                }
+            return {
+                'queries': queries,
+                'clicks': int(result.clicks[mask].sum()),
+                'impressions': int(result.impressions[mask].sum()),
+                'avg_ctr': round(float(result.ctr[mask].mean(dtype=np.float64)), 2),
+                'avg_position': round(float(result.position[mask].mean(dtype=np.float64)), 1),
+            }
         
         return {
-            'branded': {
-                'queries': len(branded),
-                'clicks': int(branded['clicks'].sum()),
-                'impressions': int(branded['impressions'].sum()),
-                'avg_ctr': round(branded['ctr'].mean(), 2) if not branded.empty else 0,
-                'avg_position': round(branded['position'].mean(), 1) if not branded.empty else 0,
-            },
-            'non_branded': {
-                'queries': len(non_branded),
-                'clicks': int(non_branded['clicks'].sum()),
-                'impressions': int(non_branded['impressions'].sum()),
-                'avg_ctr': round(non_branded['ctr'].mean(), 2) if not non_branded.empty else 0,
-                'avg_position': round(non_branded['position'].mean(), 1) if not non_branded.empty else 0,
-            }
+            'branded': segment(is_branded),
+            'non_branded': segment(~is_branded),
         }
     
     # =========================================================================
@@ -227,14 +481,13 @@ class SearchConsoleClient:
     ) -> pd.DataFrame:
         """Get top pages by clicks in search results."""
         limit = limit or self._settings.top_pages_limit
-        df = self._run_query(start_date, end_date, ['page'], row_limit=limit)
+        df = self._run_query(start_date, end_date, ['page'], row_limit=limit).to_dataframe()
         if not df.empty:
             total_clicks = df['clicks'].sum()
             df['click_share'] = (df['clicks'] / total_clicks * 100).round(2)
             df = df.sort_values('clicks', ascending=False).head(limit)
         return df
     
-    @cached(ttl_hours=24)
     def get_page_query_analysis(
         self, start_date: str, end_date: str, page_url: str
     ) -> pd.DataFrame:
@@ -250,16 +503,15 @@ class SearchConsoleClient:
             ['query'], 
             row_limit=100,
             dimension_filter=dimension_filter
-        )
+        ).to_dataframe()
     
     # =========================================================================
     # SEARCH TRENDS
     # =========================================================================
     
-    @cached(ttl_hours=24)
     def get_daily_performance(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get daily search performance trends."""
-        df = self._run_query(start_date, end_date, ['date'], row_limit=500)
+        df = self._run_query(start_date, end_date, ['date'], row_limit=500).to_dataframe()
         if not df.empty:
             df = df.sort_values('date')
         return df
@@ -267,26 +519,32 @@ class SearchConsoleClient:
     @cached(ttl_hours=24)
     def get_weekly_performance(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get weekly aggregated search performance."""
-        df = self.get_daily_performance(start_date, end_date)
+        result = self._run_query(start_date, end_date, ['date'], row_limit=500)
         
-        if df.empty:
-            return df
+        if result.empty:
+            return pd.DataFrame()
         
-        df['date'] = pd.to_datetime(df['date'])
-        df['week'] = df['date'].dt.isocalendar().week
-        df['year'] = df['date'].dt.year
+        iso = pd.to_datetime(pd.Series(result.dims['date'])).dt.isocalendar()
+        year = iso['year'].to_numpy(dtype=np.int32)
+        week = iso['week'].to_numpy(dtype=np.int32)
         
-        weekly = df.groupby(['year', 'week']).agg({
-            'clicks': 'sum',
-            'impressions': 'sum',
-            'ctr': 'mean',
-            'position': 'mean'
-        }).reset_index()
+        # Sort by (year, week) so each week is one contiguous run of rows
+        key = year * 100 + week
+        order = np.argsort(key, kind='stable')
+        _, starts, counts = np.unique(key[order], return_index=True, return_counts=True)
         
-        weekly['ctr'] = weekly['ctr'].round(2)
-        weekly['position'] = weekly['position'].round(1)
+        def total(values: np.ndarray) -> np.ndarray:
+            dtype = np.int64 if values.dtype.kind == 'i' else np.float64
+            return np.add.reduceat(values[order], starts, dtype=dtype)
         
-        return weekly
+        return pd.DataFrame({
+            'year': year[order][starts],
+            'week': week[order][starts],
+            'clicks': total(result.clicks),
+            'impressions': total(result.impressions),
+            'ctr': np.round(total(result.ctr) / counts, 2),
+            'position': np.round(total(result.position) / counts, 1),
+        })
     
     # =========================================================================
     # DEVICE & COUNTRY BREAKDOWN
@@ -295,7 +553,7 @@ class SearchConsoleClient:
     @cached(ttl_hours=24)
     def get_device_breakdown(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get search performance by device type."""
-        df = self._run_query(start_date, end_date, ['device'], row_limit=10)
+        df = self._run_query(start_date, end_date, ['device'], row_limit=10).to_dataframe()
         if not df.empty:
             total_clicks = df['clicks'].sum()
             df['click_share'] = (df['clicks'] / total_clicks * 100).round(2)
@@ -306,7 +564,7 @@ class SearchConsoleClient:
         self, start_date: str, end_date: str, limit: int = 20
     ) -> pd.DataFrame:
         """Get search performance by country."""
-        df = self._run_query(start_date, end_date, ['country'], row_limit=limit)
+        df = self._run_query(start_date, end_date, ['country'], row_limit=limit).to_dataframe()
         if not df.empty:
             total_clicks = df['clicks'].sum()
             df['click_share'] = (df['clicks'] / total_clicks * 100).round(2)
@@ -317,43 +575,30 @@ class SearchConsoleClient:
     # SEARCH APPEARANCE
     # =========================================================================
     
-    @cached(ttl_hours=24)
     def get_search_appearance(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Get performance by search appearance type.
         Shows rich results, featured snippets, etc.
         """
-        df = self._run_query(start_date, end_date, ['searchAppearance'], row_limit=50)
+        df = self._run_query(start_date, end_date, ['searchAppearance'], row_limit=50).to_dataframe()
         return df
     
     # =========================================================================
     # SUMMARY METRICS
     # =========================================================================
     
-    @cached(ttl_hours=24)
-    def get_search_overview(self, start_date: str, end_date: str) -> Dict[str, Any]:
-        """Get overall search performance summary."""
-        df = self._run_query(start_date, end_date, dimensions=[], row_limit=1)
-        
-        if df.empty:
-            return {
-                'total_clicks': 0,
-                'total_impressions': 0,
-                'avg_ctr': 0,
-                'avg_position': 0,
-            }
-        
-        # Need to query without dimensions for totals
-        request_body = {
+    def _overview_body(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Request body for the overview; without dimensions GSC returns totals."""
+        return {
             'startDate': start_date,
             'endDate': end_date,
             'dataState': 'final',
         }
-        
-        response = self._service.searchanalytics().query(
-            siteUrl=self.site_url,
-            body=request_body
-        ).execute()
+    
+    @cached(ttl_hours=24)
+    def get_search_overview(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Get overall search performance summary."""
+        response = self._query(self._overview_body(start_date, end_date))
         
         rows = response.get('rows', [])
         if rows:
@@ -376,23 +621,43 @@ class SearchConsoleClient:
     # CONVENIENCE METHODS
     # =========================================================================
     
+    @cached(ttl_hours=24)
     def get_all_metrics(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """
         Get all search console metrics in a single call.
         
         Returns a dictionary with all data categories.
+        
+        Every query the report needs is sent in one batch HTTP request
+        first, and the individual methods then build their results from
+        those responses.
         """
-        return {
-            'overview': self.get_search_overview(start_date, end_date),
-            'top_keywords_clicks': self.get_top_keywords_by_clicks(start_date, end_date),
-            'top_keywords_impressions': self.get_top_keywords_by_impressions(start_date, end_date),
-            'top_keywords_ctr': self.get_top_keywords_by_ctr(start_date, end_date),
-            'keyword_opportunities': self.get_keyword_opportunities(start_date, end_date),
-            'branded_vs_nonbranded': self.get_branded_vs_nonbranded(start_date, end_date),
-            'top_pages': self.get_top_pages(start_date, end_date),
-            'daily_performance': self.get_daily_performance(start_date, end_date),
-            'device_breakdown': self.get_device_breakdown(start_date, end_date),
-            'country_breakdown': self.get_country_breakdown(start_date, end_date),
-            'search_appearance': self.get_search_appearance(start_date, end_date),
-        }
-
+        keyword_limit = self._settings.top_keywords_limit
+        prefetched = self._prefetch([
+            self._overview_body(start_date, end_date),
+            self._query_body(start_date, end_date, ['query'], row_limit=keyword_limit),
+            self._query_body(start_date, end_date, ['query'], row_limit=1000),
+            self._query_body(start_date, end_date, ['page'], row_limit=self._settings.top_pages_limit),
+            self._query_body(start_date, end_date, ['date'], row_limit=500),
+            self._query_body(start_date, end_date, ['device'], row_limit=10),
+            self._query_body(start_date, end_date, ['country'], row_limit=20),
+            self._query_body(start_date, end_date, ['searchAppearance'], row_limit=50),
+        ])
+        
+        token = _PREFETCHED.set(prefetched)
+        try:
+            return {
+                'overview': self.get_search_overview(start_date, end_date),
+                'top_keywords_clicks': self.get_top_keywords_by_clicks(start_date, end_date),
+                'top_keywords_impressions': self.get_top_keywords_by_impressions(start_date, end_date),
+                'top_keywords_ctr': self.get_top_keywords_by_ctr(start_date, end_date),
+                'keyword_opportunities': self.get_keyword_opportunities(start_date, end_date),
+                'branded_vs_nonbranded': self.get_branded_vs_nonbranded(start_date, end_date),
+                'top_pages': self.get_top_pages(start_date, end_date),
+                'daily_performance': self.get_daily_performance(start_date, end_date),
+                'device_breakdown': self.get_device_breakdown(start_date, end_date),
+                'country_breakdown': self.get_country_breakdown(start_date, end_date),
+                'search_appearance': self.get_search_appearance(start_date, end_date),
+            }
+        finally:
+            _PREFETCHED.reset(token)
@@ -17,14 +17,29 @@ API Documentation: https://help.hotjar.com/hc/en-us/articles/360033640653-Hotjar
 
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from collections import Counter
+from itertools import islice
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import requests
 
 from config.settings import ClientConfig, get_settings
-from src.utils.cache import cached
+from src.utils.cache import cached, single_flight
+from src.utils.http import create_session, warm_up
 
 
-@dataclass
+log = logging.getLogger(__name__)
+
+# Shared by all Hotjar clients so connections to the API are reused;
+# each client sends its own Authorization header per request
+_SESSION = create_session()
+
+# Items requested per page from paginated list endpoints
+PAGE_SIZE = 100
+
+
+@dataclass(slots=True)
 class SurveyResponse:
     """A single survey response."""
     response_id: str
@@ -37,11 +52,11 @@ class SurveyResponse:
     country: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackItem:
     """A single feedback widget response."""
     feedback_id: str
-    emotion: str  # happy, neutral, sad
+    emotion: str  # happy, neutral, sad (lowercase)
     message: str
     page_url: str
     submitted_at: str
@@ -81,6 +96,9 @@ class HotjarClient:
         self.api_token = api_token
         self._settings = get_settings()
         
+        # When each method last fell back to stale cached data (see @cached)
+        self.stale_since: Dict[str, str] = {}
+        
         # Check if Hotjar is configured
         self.is_configured = bool(site_id and api_token)
         
@@ -89,6 +107,9 @@ class HotjarClient:
                 "Authorization": f"Bearer {api_token}",
                 "Content-Type": "application/json",
             }
+            
+            # Have a connection ready by the time the first request is made
+            warm_up(_SESSION, "https://api.hotjar.com/")
     
     def _make_request(
         self,
@@ -104,7 +125,7 @@ class HotjarClient:
         url = f"{self.API_BASE}/sites/{self.site_id}/{endpoint}"
         
         try:
-            response = requests.request(
+            response = _SESSION.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -116,29 +137,55 @@ class HotjarClient:
             if response.status_code == 200:
                 return response.json()
             elif response.status_code == 401:
-                print("    ⚠️ Hotjar authentication failed - check API token")
+                log.warning("Hotjar authentication failed - check API token")
                 return None
             elif response.status_code == 404:
-                print("    ⚠️ Hotjar resource not found - check Site ID")
+                log.warning("Hotjar resource not found - check Site ID")
                 return None
             else:
-                print(f"    ⚠️ Hotjar API error: {response.status_code}")
+                log.warning("Hotjar API error: %s", response.status_code)
                 return None
                 
         except requests.RequestException as e:
-            print(f"    ⚠️ Hotjar request failed: {e}")
+            log.warning("Hotjar request failed: %s", e)
             return None
     
-    @cached(ttl_hours=24)
-    def get_surveys(self) -> List[Dict[str, Any]]:
-        """Get list of all surveys."""
+    def _paginate(self, endpoint: str, params: Dict, target: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch up to target items from a list endpoint, one page at a time.
+        
+        Pages of PAGE_SIZE are requested with increasing offsets until the
+        target is reached or the API returns a short page. Returns None if
+        any page request fails, so partial data is never mistaken for the
+        full list.
+        """
+        items = []
+        while len(items) < target:
+            page_size = min(PAGE_SIZE, target - len(items))
+            data = self._make_request(
+                endpoint,
+                params={**params, "limit": page_size, "offset": len(items)}
+            )
+            if data is None:
+                return None
+            
+            page = data.get("data", [])
+            items.extend(page)
+            if len(page) < page_size:
+                break
+        return items
+    
+    @cached(ttl_hours=24, stale_ok=True)
+    @single_flight
+    def get_surveys(self) -> Optional[List[Dict[str, Any]]]:
+        """Get list of all surveys, or None if the request failed."""
         if not self.is_configured:
             return []
         
         data = self._make_request("surveys")
-        if data:
-            return data.get("data", [])
-        return []
+        if data is None:
+            return None
+        return data.get("data", [])
     
     @cached(ttl_hours=12)
     def get_survey_responses(
@@ -189,13 +236,13 @@ class HotjarClient:
         
         return responses
     
-    @cached(ttl_hours=12)
+    @cached(ttl_hours=12, stale_ok=True)
     def get_feedback(
         self,
         start_date: str = None,
         end_date: str = None,
         limit: int = 100
-    ) -> List[FeedbackItem]:
+    ) -> Optional[List[FeedbackItem]]:
         """
         Get feedback widget responses.
         
@@ -205,27 +252,26 @@ class HotjarClient:
             limit: Max items to return
         
         Returns:
-            List of FeedbackItem objects
+            List of FeedbackItem objects, or None if a request failed
         """
         if not self.is_configured:
             return []
         
-        params = {"limit": limit}
+        params = {}
         if start_date:
             params["from"] = start_date
         if end_date:
             params["to"] = end_date
         
-        data = self._make_request("feedback", params=params)
-        
-        if not data:
-            return []
+        items = self._paginate("feedback", params, limit)
+        if items is None:
+            return None
         
         feedback = []
-        for item in data.get("data", []):
+        for item in items:
             feedback.append(FeedbackItem(
                 feedback_id=str(item.get("id", "")),
-                emotion=item.get("emotion", "neutral"),
+                emotion=(item.get("emotion") or "neutral").lower(),
                 message=item.get("message", ""),
                 page_url=item.get("page_url", ""),
                 submitted_at=item.get("created_at", ""),
@@ -249,6 +295,9 @@ class HotjarClient:
         
         feedback = self.get_feedback(start_date, end_date, limit=500)
         
+        if feedback is None:
+            return {"available": False, "reason": "Hotjar feedback request failed"}
+        
         if not feedback:
             return {
                 "available": True,
@@ -257,11 +306,8 @@ class HotjarClient:
             }
         
         # Sentiment breakdown
-        sentiment_counts = {"happy": 0, "neutral": 0, "sad": 0}
-        for item in feedback:
-            emotion = item.emotion.lower()
-            if emotion in sentiment_counts:
-                sentiment_counts[emotion] += 1
+        counts = Counter(item.emotion for item in feedback)
+        sentiment_counts = {k: counts[k] for k in ("happy", "neutral", "sad")}
         
         total = len(feedback)
         sentiment_pct = {
@@ -273,11 +319,11 @@ class HotjarClient:
         # happy = promoters, sad = detractors
         nps = sentiment_pct.get("happy", 0) - sentiment_pct.get("sad", 0)
         
-        # Recent feedback messages (for qualitative insights)
+        # Up to 20 recent feedback messages (for qualitative insights);
+        # the scan stops as soon as 20 items with a message are found
         recent_messages = [
             {"emotion": f.emotion, "message": f.message[:200], "page": f.page_url}
-            for f in feedback[:20]
-            if f.message
+            for f in islice((f for f in feedback if f.message), 20)
         ]
         
         return {
@@ -296,12 +342,17 @@ class HotjarClient:
     ) -> Dict[str, Any]:
         """
         Get summarized survey data for a period.
+        
+        Responses for the surveys are fetched concurrently.
         """
         if not self.is_configured:
             return {"available": False, "reason": "Hotjar not configured"}
         
         surveys = self.get_surveys()
         
+        if surveys is None:
+            return {"available": False, "reason": "Hotjar surveys request failed"}
+        
         if not surveys:
             return {
                 "available": True,
@@ -309,15 +360,21 @@ class HotjarClient:
                 "total_responses": 0,
             }
         
+        recent = surveys[:5]  # Limit to 5 most recent surveys
+        with ThreadPoolExecutor(max_workers=len(recent)) as executor:
+            all_responses = list(executor.map(
+                lambda survey: self.get_survey_responses(
+                    str(survey.get("id", "")), start_date, end_date
+                ),
+                recent
+            ))
+        
         total_responses = 0
         survey_data = []
         
-        for survey in surveys[:5]:  # Limit to 5 most recent surveys
-            survey_id = str(survey.get("id", ""))
+        for survey, responses in zip(recent, all_responses):
             survey_name = survey.get("name", "Unnamed Survey")
             
-            responses = self.get_survey_responses(survey_id, start_date, end_date)
-            
             survey_data.append({
                 "name": survey_name,
                 "responses": len(responses),
@@ -347,10 +404,10 @@ class HotjarClient:
                 "reason": "Hotjar not configured - add site_id and api_token to client config"
             }
         
-        print("    📊 Fetching Hotjar feedback...")
+        log.info("Fetching Hotjar feedback")
         feedback = self.get_feedback_summary(start_date, end_date)
         
-        print("    📋 Fetching Hotjar surveys...")
+        log.info("Fetching Hotjar surveys")
         surveys = self.get_survey_summary(start_date, end_date)
         
         return {
@@ -15,14 +15,50 @@ Provides:
 
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import heapq
+import logging
 import requests
 import time
 
 from config.settings import ClientConfig, get_settings
-from src.utils.cache import cached
+from src.utils.cache import cached, single_flight
+from src.utils.http import create_session, warm_up
 
 
-@dataclass
+log = logging.getLogger(__name__)
+
+# Shared by all PageSpeed clients so connections to the API are reused
+_SESSION = create_session()
+
+# Runs desktop analyses in the background while mobile runs in the caller
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Partial response: only the parts of the Lighthouse result that
+# _parse_result reads (this drops screenshots, i18n strings, timing, ...)
+_RESPONSE_FIELDS = "id,lighthouseResult(categories,audits)"
+
+# Stand-in for a missing audit; never modified
+_EMPTY: Dict[str, Any] = {}
+
+# Lighthouse audits holding the Core Web Vitals, in PerformanceMetrics order
+_METRIC_IDS = (
+    "first-contentful-paint", "largest-contentful-paint", "total-blocking-time",
+    "cumulative-layout-shift", "speed-index", "interactive",
+)
+_metric_audits = itemgetter(*_METRIC_IDS)
+
+# Lighthouse audits reported as diagnostics, in report order
+_DIAGNOSTIC_IDS = (
+    "dom-size", "uses-responsive-images", "offscreen-images",
+    "render-blocking-resources", "uses-optimized-images",
+    "modern-image-formats", "uses-text-compression",
+    "uses-rel-preconnect", "server-response-time"
+)
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Core performance metrics."""
     score: int  # 0-100
@@ -34,7 +70,7 @@ class PerformanceMetrics:
     tti: float  # Time to Interactive (seconds)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSpeedResult:
     """Complete PageSpeed result."""
     url: str
@@ -74,6 +110,12 @@ class PageSpeedClient:
         self.api_key = api_key
         self.site_url = client_config.gsc_site_url.rstrip('/')
         self._settings = get_settings()
+        
+        # When each analysis last fell back to stale cached data (see @cached)
+        self.stale_since: Dict[str, str] = {}
+        
+        # Have a connection ready by the time the first analysis is requested
+        warm_up(_SESSION, "https://www.googleapis.com/")
     
     def _make_request(
         self,
@@ -99,13 +141,14 @@ class PageSpeedClient:
             "url": url,
             "strategy": strategy,
             "category": categories,
+            "fields": _RESPONSE_FIELDS,
         }
         
         if self.api_key:
             params["key"] = self.api_key
         
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 self.API_URL,
                 params=params,
                 timeout=60  # PageSpeed can be slow
@@ -116,18 +159,29 @@ class PageSpeedClient:
             elif response.status_code == 429:
                 # Rate limited - wait and retry once
                 time.sleep(2)
-                response = requests.get(self.API_URL, params=params, timeout=60)
+                response = _SESSION.get(self.API_URL, params=params, timeout=60)
                 if response.status_code == 200:
                     return response.json()
             
             return None
             
         except requests.RequestException as e:
-            print(f"    ⚠️ PageSpeed request failed: {e}")
+            log.warning("PageSpeed request failed: %s", e)
             return None
     
-    def _parse_result(self, data: Dict[str, Any], strategy: str) -> Optional[PageSpeedResult]:
-        """Parse API response into structured result."""
+    def _parse_result(
+        self,
+        data: Dict[str, Any],
+        strategy: str,
+        mode: str = "full"
+    ) -> Optional[PageSpeedResult]:
+        """
+        Parse API response into structured result.
+        
+        mode="summary" only extracts the performance score and Core Web
+        Vitals; opportunities and diagnostics are left empty and the
+        audit counts are 0.
+        """
         try:
             lighthouse = data.get("lighthouseResult", {})
             categories = lighthouse.get("categories", {})
@@ -137,81 +191,100 @@ class PageSpeedClient:
             perf_category = categories.get("performance", {})
             perf_score = int((perf_category.get("score", 0) or 0) * 100)
             
-            # Core Web Vitals
-            def get_metric(audit_id: str, field: str = "numericValue") -> float:
-                audit = audits.get(audit_id, {})
-                value = audit.get(field, 0) or 0
-                return value
+            # Core Web Vitals; the metric audits are normally all present,
+            # so fetch them in one go and only fall back when one is missing
+            try:
+                metric_audits = _metric_audits(audits)
+            except KeyError:
+                metric_audits = [audits.get(audit_id) for audit_id in _METRIC_IDS]
+            fcp, lcp, tbt, cls, si, tti = [
+                (audit or _EMPTY).get("numericValue") or 0 for audit in metric_audits
+            ]
             
             metrics = PerformanceMetrics(
                 score=perf_score,
-                fcp=get_metric("first-contentful-paint") / 1000,  # Convert to seconds
-                lcp=get_metric("largest-contentful-paint") / 1000,
-                tbt=get_metric("total-blocking-time"),  # Already in ms
-                cls=get_metric("cumulative-layout-shift", "numericValue"),
-                si=get_metric("speed-index") / 1000,
-                tti=get_metric("interactive") / 1000,
+                fcp=fcp / 1000,  # Convert to seconds
+                lcp=lcp / 1000,
+                tbt=tbt,  # Already in ms
+                cls=cls,
+                si=si / 1000,
+                tti=tti / 1000,
             )
             
-            # Opportunities (things to fix)
+            # Opportunities (things to fix), diagnostics and passed/failed
+            # counts are all collected in a single pass over the audits
+            # (skipped in summary mode, which only needs the score and metrics)
+            passed = failed = 0
             opportunities = []
-            for audit_id, audit in audits.items():
-                if audit.get("details", {}).get("type") == "opportunity":
-                    if audit.get("score") is not None and audit.get("score", 1) < 1:
-                        savings = audit.get("details", {}).get("overallSavingsMs", 0)
-                        opportunities.append({
+            diagnostics = []
+            if mode == "full":
+                found_diagnostics = {}
+                for audit_id, audit in audits.items():
+                    score = audit.get("score")
+                    if score == 1:
+                        passed += 1
+                    elif score is not None and score < 1:
+                        failed += 1
+                        details = audit.get("details")
+                        if details and details.get("type") == "opportunity":
+                            opportunities.append({
+                                "id": audit_id,
+                                "title": audit.get("title", ""),
+                                "description": audit.get("description", ""),
+                                "savings_ms": details.get("overallSavingsMs", 0),
+                                "score": score,
+                            })
+                    
+                    if audit_id in _DIAGNOSTIC_IDS and audit:
+                        found_diagnostics[audit_id] = {
                             "id": audit_id,
                             "title": audit.get("title", ""),
-                            "description": audit.get("description", ""),
-                            "savings_ms": savings,
-                            "score": audit.get("score", 0),
-                        })
-            
-            # Sort by potential savings
-            opportunities.sort(key=lambda x: x.get("savings_ms", 0), reverse=True)
-            
-            # Diagnostics
-            diagnostics = []
-            diagnostic_ids = [
-                "dom-size", "uses-responsive-images", "offscreen-images",
-                "render-blocking-resources", "uses-optimized-images",
-                "modern-image-formats", "uses-text-compression",
-                "uses-rel-preconnect", "server-response-time"
-            ]
-            for audit_id in diagnostic_ids:
-                audit = audits.get(audit_id, {})
-                if audit:
-                    diagnostics.append({
-                        "id": audit_id,
-                        "title": audit.get("title", ""),
-                        "displayValue": audit.get("displayValue", ""),
-                        "score": audit.get("score"),
-                    })
-            
-            # Count passed/failed
-            passed = sum(1 for a in audits.values() if a.get("score") == 1)
-            failed = sum(1 for a in audits.values() if a.get("score") is not None and a.get("score") < 1)
+                            "displayValue": audit.get("displayValue", ""),
+                            "score": score,
+                        }
+                
+                # Top 10 by potential savings
+                opportunities = heapq.nlargest(10, opportunities, key=lambda x: x["savings_ms"])
+                
+                # Diagnostics, in their fixed order
+                diagnostics = [
+                    found_diagnostics[audit_id]
+                    for audit_id in _DIAGNOSTIC_IDS
+                    if audit_id in found_diagnostics
+                ]
             
             return PageSpeedResult(
                 url=data.get("id", ""),
                 strategy=strategy,
                 performance_score=perf_score,
                 metrics=metrics,
-                opportunities=opportunities[:10],
+                opportunities=opportunities,
                 diagnostics=diagnostics,
                 passed_audits=passed,
                 failed_audits=failed,
             )
             
         except Exception as e:
-            print(f"    ⚠️ Error parsing PageSpeed result: {e}")
+            log.warning("Error parsing PageSpeed result: %s", e)
             return None
     
-    @cached(ttl_hours=24)
+    def _page_url(self, url: Optional[str]) -> str:
+        """
+        The form of url used for requests and cache keys.
+        
+        None and the bare site URL both mean the homepage, which is always
+        requested with a trailing slash, as analyze_key_pages builds it.
+        """
+        url = url or self.site_url
+        if url.rstrip('/') == self.site_url:
+            return f"{self.site_url}/"
+        return url
+    
     def analyze_url(
         self,
         url: str = None,
-        strategy: str = "mobile"
+        strategy: str = "mobile",
+        mode: str = "full"
     ) -> Optional[PageSpeedResult]:
         """
         Analyze a single URL.
@@ -219,15 +292,23 @@ class PageSpeedClient:
         Args:
             url: URL to analyze (defaults to site homepage)
             strategy: "mobile" or "desktop"
+            mode: "full", or "summary" for score and metrics only
         
         Returns:
             PageSpeedResult or None
-        """
-        url = url or self.site_url
         
+        The URL is normalized and passed positionally, so every spelling
+        of the same request shares one cache entry and one in-flight call.
+        """
+        return self._analyze(self._page_url(url), strategy, mode)
+    
+    @cached(ttl_hours=24, stale_ok=True)
+    @single_flight
+    def _analyze(self, url: str, strategy: str, mode: str) -> Optional[PageSpeedResult]:
+        """Run and parse one PageSpeed analysis (see analyze_url)."""
         data = self._make_request(url, strategy)
         if data:
-            return self._parse_result(data, strategy)
+            return self._parse_result(data, strategy, mode)
         return None
     
     def get_performance_overview(self) -> Dict[str, Any]:
@@ -236,12 +317,18 @@ class PageSpeedClient:
         
         Returns:
             Dict with mobile and desktop results
+        
+        Each analysis takes tens of seconds server-side, so desktop is
+        started in the background before mobile runs in this thread.
         """
-        print("    📱 Analyzing mobile performance...")
-        mobile = self.analyze_url(strategy="mobile")
+        mode = "summary" if self._settings.fast_mode else "full"
+        
+        log.info("Analyzing desktop performance")
+        desktop_future = _EXECUTOR.submit(self.analyze_url, strategy="desktop", mode=mode)
         
-        print("    🖥️  Analyzing desktop performance...")
-        desktop = self.analyze_url(strategy="desktop")
+        log.info("Analyzing mobile performance")
+        mobile = self.analyze_url(strategy="mobile", mode=mode)
+        desktop = desktop_future.result()
         
         result = {
             "available": mobile is not None or desktop is not None,
@@ -331,15 +418,22 @@ class PageSpeedClient:
         
         Returns:
             Dict mapping page path to results
+        
+        Pages are analyzed concurrently.
         """
         if pages is None:
             pages = ["/"]  # Just homepage by default
         
+        with ThreadPoolExecutor(max_workers=self._settings.api_max_workers) as executor:
+            futures = {}
+            for page in pages:
+                url = f"{self.site_url}{page}"
+                log.info("Analyzing %s", url)
+                futures[page] = executor.submit(self.analyze_url, url, "mobile")
+        
         results = {}
-        for page in pages:
-            url = f"{self.site_url}{page}"
-            print(f"    Analyzing: {url}")
-            result = self.analyze_url(url, "mobile")
+        for page, future in futures.items():
+            result = future.result()
             if result:
                 results[page] = {
                     "score": result.performance_score,
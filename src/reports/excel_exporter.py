@@ -10,20 +10,89 @@ Creates multi-sheet workbooks with:
 - Charts
 """
 
+from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import (
-    Font, PatternFill, Alignment, Border, Side,
-    NamedStyle
-)
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.chart import BarChart, LineChart, PieChart, Reference
-from openpyxl.formatting.rule import ColorScaleRule, FormulaRule
+import xlsxwriter
+from xlsxwriter.format import Format
 
 from config.settings import OUTPUT_DIR, ClientConfig
 
+# Color palette (in the '#RRGGBB' form xlsxwriter takes as-is)
+_PRIMARY = '#2D5016'      # Forest green
+_SECONDARY = '#F4C430'    # Honey gold
+_HEADER = '#1F4E0F'       # Dark green
+_POSITIVE = '#22C55E'     # Green
+_NEGATIVE = '#EF4444'     # Red
+_LIGHT_BG = '#F8F9FA'     # Light gray
+_WHITE = '#FFFFFF'
+
+
+@dataclass(slots=True, frozen=True)
+class _Styles:
+    """A workbook's registered cell formats, one per ExcelExporter.STYLES entry."""
+    report_title: Format
+    title: Format
+    period: Format
+    header: Format
+    subheader: Format
+    metric_label: Format
+    metric_value: Format
+    positive: Format
+    negative: Format
+    wrap: Format
+    positive_text: Format
+    negative_text: Format
+    opportunity_text: Format
+    decimal_2: Format
+    decimal_1: Format
+
+
+@dataclass(slots=True)
+class _ReportView:
+    """The parts of a report dict the sheets read, looked up once per export."""
+    current_period: Dict[str, Any]
+    previous_period: Dict[str, Any]
+    traffic: Dict[str, Any]
+    traffic_comparison: Dict[str, Any]
+    traffic_by_month: pd.DataFrame
+    top_pages: pd.DataFrame
+    landing_pages: pd.DataFrame
+    devices: pd.DataFrame
+    geography: pd.DataFrame
+    new_vs_returning: Dict[str, Any]
+    channels: pd.DataFrame
+    paid_search: Dict[str, Any]
+    search_overview: Dict[str, Any]
+    top_keywords: pd.DataFrame
+    insights: Dict[str, Any]
+    
+    @classmethod
+    def from_report(cls, data: Dict[str, Any]) -> '_ReportView':
+        """Flatten the nested report dict, filling in empty defaults."""
+        metadata = data.get('metadata', {})
+        ga4 = data.get('ga4', {})
+        gsc = data.get('gsc', {})
+        return cls(
+            current_period=metadata.get('current_period', {}),
+            previous_period=metadata.get('previous_period', {}),
+            traffic=ga4.get('traffic_overview', {}),
+            traffic_comparison=data.get('comparison', {}).get('traffic_overview', {}),
+            traffic_by_month=ga4.get('traffic_by_month', pd.DataFrame()),
+            top_pages=ga4.get('top_pages', pd.DataFrame()),
+            landing_pages=ga4.get('landing_pages', pd.DataFrame()),
+            devices=ga4.get('device_breakdown', pd.DataFrame()),
+            geography=ga4.get('geography', pd.DataFrame()),
+            new_vs_returning=ga4.get('new_vs_returning', {}),
+            channels=ga4.get('traffic_by_channel', pd.DataFrame()),
+            paid_search=ga4.get('paid_search', {}),
+            search_overview=gsc.get('overview', {}),
+            top_keywords=gsc.get('top_keywords_clicks', pd.DataFrame()),
+            insights=data.get('insights', {}),
+        )
+
 
 class ExcelExporter:
     """
@@ -36,60 +105,50 @@ class ExcelExporter:
     - Professional styling
     """
     
-    # Color palette
-    COLORS = {
-        'primary': '2D5016',      # Forest green
-        'secondary': 'F4C430',    # Honey gold
-        'header': '1F4E0F',       # Dark green
-        'positive': '22C55E',     # Green
-        'negative': 'EF4444',     # Red
-        'neutral': '888888',      # Gray
-        'light_bg': 'F8F9FA',     # Light gray
-        'white': 'FFFFFF',
+    # Cell formats, as xlsxwriter format properties
+    STYLES = {
+        'report_title': {'bold': True, 'font_size': 16, 'font_color': _PRIMARY},
+        'title': {'bold': True, 'font_size': 14, 'font_color': _PRIMARY},
+        'period': {'font_size': 12, 'italic': True},
+        'header': {
+            'bold': True, 'font_color': _WHITE, 'font_size': 11,
+            'bg_color': _HEADER,
+            'align': 'center', 'valign': 'vcenter',
+            'bottom': 1, 'bottom_color': '#000000',
+        },
+        'subheader': {
+            'bold': True, 'font_color': _PRIMARY, 'font_size': 10,
+            'bg_color': _LIGHT_BG,
+        },
+        'metric_label': {'bold': True, 'font_size': 10, 'align': 'left'},
+        'metric_value': {'font_size': 10, 'align': 'right'},
+        'positive': {'font_color': _POSITIVE, 'bold': True},
+        'negative': {'font_color': _NEGATIVE, 'bold': True},
+        'wrap': {'text_wrap': True},
+        'positive_text': {'font_color': _POSITIVE},
+        'negative_text': {'font_color': _NEGATIVE},
+        'opportunity_text': {'font_color': _SECONDARY},
+        'decimal_2': {'num_format': '0.00'},
+        'decimal_1': {'num_format': '0.0'},
     }
     
     def __init__(self, client_config: ClientConfig):
         """Initialize exporter with client configuration."""
         self.config = client_config
         self.wb = None
-        self._setup_styles()
+        self.styles = None
     
     def _setup_styles(self):
-        """Create named styles for consistent formatting."""
-        self.styles = {
-            'header': {
-                'font': Font(bold=True, color='FFFFFF', size=11),
-                'fill': PatternFill('solid', fgColor=self.COLORS['header']),
-                'alignment': Alignment(horizontal='center', vertical='center'),
-                'border': Border(
-                    bottom=Side(style='thin', color='000000')
-                )
-            },
-            'subheader': {
-                'font': Font(bold=True, color=self.COLORS['primary'], size=10),
-                'fill': PatternFill('solid', fgColor=self.COLORS['light_bg']),
-            },
-            'metric_label': {
-                'font': Font(bold=True, size=10),
-                'alignment': Alignment(horizontal='left'),
-            },
-            'metric_value': {
-                'font': Font(size=10),
-                'alignment': Alignment(horizontal='right'),
-            },
-            'positive': {
-                'font': Font(color=self.COLORS['positive'], bold=True),
-            },
-            'negative': {
-                'font': Font(color=self.COLORS['negative'], bold=True),
-            },
-        }
-    
-    def _apply_style(self, cell, style_name: str):
-        """Apply a named style to a cell."""
-        style = self.styles.get(style_name, {})
-        for attr, value in style.items():
-            setattr(cell, attr, value)
+        """
+        Register STYLES with the current workbook.
+        
+        xlsxwriter formats belong to a workbook, so this runs once per
+        export. Every cell then reuses these objects.
+        """
+        self.styles = _Styles(**{
+            name: self.wb.add_format(properties)
+            for name, properties in self.STYLES.items()
+        })
     
     def export(
         self,
@@ -106,57 +165,67 @@ class ExcelExporter:
         Returns:
             Path to created Excel file
         """
-        self.wb = Workbook()
-        
-        # Remove default sheet
-        default_sheet = self.wb.active
-        self.wb.remove(default_sheet)
-        
-        # Create sheets
-        self._create_executive_summary(report_data)
-        self._create_traffic_overview(report_data)
-        self._create_search_performance(report_data)
-        self._create_content_performance(report_data)
-        self._create_audience_insights(report_data)
-        self._create_acquisition_channels(report_data)
-        self._create_insights_sheet(report_data)
+        report = _ReportView.from_report(report_data)
         
         # Generate filename
         if filename is None:
-            period = report_data.get('metadata', {}).get('current_period', {}).get('label', 'report')
+            period = report.current_period.get('label', 'report')
             client_name = self.config.name
             filename = f"{client_name}_quarterly_report_{period.replace(' ', '_')}.xlsx"
         
         output_path = OUTPUT_DIR / filename
-        self.wb.save(output_path)
+        
+        # xlsxwriter serializes cells straight to XML, with no in-memory
+        # cell objects to build and style. constant_memory flushes each row
+        # as soon as a later one is started, so every sheet must be written
+        # top to bottom.
+        self.wb = xlsxwriter.Workbook(output_path, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd',
+        })
+        self._setup_styles()
+        
+        # Create sheets
+        self._create_executive_summary(report)
+        self._create_traffic_overview(report)
+        self._create_search_performance(report)
+        self._create_content_performance(report)
+        self._create_audience_insights(report)
+        self._create_acquisition_channels(report)
+        self._create_insights_sheet(report)
+        
+        self.wb.close()
         
         return output_path
     
-    def _create_executive_summary(self, data: Dict[str, Any]):
+    def _create_executive_summary(self, report: _ReportView):
         """Create executive summary sheet."""
-        ws = self.wb.create_sheet("Executive Summary")
+        ws = self.wb.add_worksheet("Executive Summary")
+        styles = self.styles
         
         # Title
-        ws['A1'] = f"{self.config.display_name} - Quarterly Analytics Report"
-        ws['A1'].font = Font(bold=True, size=16, color=self.COLORS['primary'])
-        ws.merge_cells('A1:F1')
+        ws.merge_range(
+            0, 0, 0, 5,
+            f"{self.config.display_name} - Quarterly Analytics Report",
+            styles.report_title
+        )
         
         # Period
-        metadata = data.get('metadata', {})
-        current = metadata.get('current_period', {})
-        previous = metadata.get('previous_period', {})
+        current = report.current_period
+        previous = report.previous_period
         
-        ws['A3'] = f"Period: {current.get('label', 'N/A')} vs {previous.get('label', 'N/A')}"
-        ws['A3'].font = Font(size=12, italic=True)
+        ws.write(
+            2, 0,
+            f"Period: {current.get('label', 'N/A')} vs {previous.get('label', 'N/A')}",
+            styles.period
+        )
         
         # Key Metrics Section
-        ws['A5'] = "KEY METRICS"
-        self._apply_style(ws['A5'], 'header')
-        ws.merge_cells('A5:D5')
+        ws.merge_range(4, 0, 4, 3, "KEY METRICS", styles.header)
         
         # Traffic metrics
-        traffic = data.get('ga4', {}).get('traffic_overview', {})
-        comparison = data.get('comparison', {}).get('traffic_overview', {})
+        traffic = report.traffic
+        comparison = report.traffic_comparison
         
         metrics = [
             ('Total Users', 'total_users'),
@@ -167,229 +236,205 @@ class ExcelExporter:
             ('Avg Session Duration (sec)', 'avg_session_duration'),
         ]
         
-        row = 7
-        ws[f'A{row}'] = 'Metric'
-        ws[f'B{row}'] = 'Current'
-        ws[f'C{row}'] = 'Previous'
-        ws[f'D{row}'] = 'Change'
-        
-        for col in ['A', 'B', 'C', 'D']:
-            self._apply_style(ws[f'{col}{row}'], 'subheader')
+        row = 6
+        ws.write_row(row, 0, ['Metric', 'Current', 'Previous', 'Change'], styles.subheader)
         
-        row += 1
+        # Resolve each metric's values and change styling first, so the
+        # write loop is just writes
+        change_formats = {'up': styles.positive, 'down': styles.negative}
+        metric_rows = []
         for label, key in metrics:
-            current_val = traffic.get(key, 0)
             comp_data = comparison.get(key, {})
-            prev_val = comp_data.get('previous', 0) if isinstance(comp_data, dict) else 0
-            change = comp_data.get('change', {}) if isinstance(comp_data, dict) else {}
-            
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = current_val
-            ws[f'C{row}'] = prev_val
+            if not isinstance(comp_data, dict):
+                comp_data = {}
             
+            change = comp_data.get('change', {})
             if isinstance(change, dict):
                 change_str = change.get('formatted', 'N/A')
-                ws[f'D{row}'] = change_str
-                if change.get('direction') == 'up':
-                    self._apply_style(ws[f'D{row}'], 'positive')
-                elif change.get('direction') == 'down':
-                    self._apply_style(ws[f'D{row}'], 'negative')
+                change_format = change_formats.get(change.get('direction'))
+            else:
+                change_str, change_format = None, None
             
+            metric_rows.append((
+                label, traffic.get(key, 0), comp_data.get('previous', 0),
+                change_str, change_format,
+            ))
+        
+        row += 1
+        for label, current_val, prev_val, change_str, change_format in metric_rows:
+            ws.write_row(row, 0, (label, current_val, prev_val))
+            ws.write(row, 3, change_str, change_format)
             row += 1
         
         # Executive Summary text
         row += 2
-        ws[f'A{row}'] = "EXECUTIVE SUMMARY"
-        self._apply_style(ws[f'A{row}'], 'header')
-        ws.merge_cells(f'A{row}:F{row}')
+        ws.merge_range(row, 0, row, 5, "EXECUTIVE SUMMARY", styles.header)
         
         row += 2
-        insights = data.get('insights', {})
+        insights = report.insights
         summary = insights.get('executive_summary', 'No summary available.')
-        ws[f'A{row}'] = summary
-        ws.merge_cells(f'A{row}:F{row + 2}')
-        ws[f'A{row}'].alignment = Alignment(wrap_text=True)
+        ws.merge_range(row, 0, row + 2, 5, summary, styles.wrap)
         
         # Key Recommendations
         row += 5
-        ws[f'A{row}'] = "KEY RECOMMENDATIONS"
-        self._apply_style(ws[f'A{row}'], 'header')
-        ws.merge_cells(f'A{row}:F{row}')
+        ws.merge_range(row, 0, row, 5, "KEY RECOMMENDATIONS", styles.header)
         
         row += 2
         recommendations = insights.get('key_recommendations', [])
         for i, rec in enumerate(recommendations[:5], 1):
-            ws[f'A{row}'] = f"{i}. {rec}"
-            ws.merge_cells(f'A{row}:F{row}')
-            ws[f'A{row}'].alignment = Alignment(wrap_text=True)
+            ws.merge_range(row, 0, row, 5, f"{i}. {rec}", styles.wrap)
             row += 1
         
         # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 15
+        self._set_widths(ws, [30, 15, 15, 15, 15, 15])
     
-    def _create_traffic_overview(self, data: Dict[str, Any]):
+    def _create_traffic_overview(self, report: _ReportView):
         """Create traffic overview sheet."""
-        ws = self.wb.create_sheet("Traffic Overview")
+        ws = self.wb.add_worksheet("Traffic Overview")
         
         # Title
-        ws['A1'] = "Website Traffic Overview"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Website Traffic Overview", self.styles.title)
         
         # Monthly data
-        monthly = data.get('ga4', {}).get('traffic_by_month', pd.DataFrame())
+        monthly = report.traffic_by_month
         
         if not monthly.empty:
-            ws['A3'] = "Monthly Traffic Breakdown"
-            self._apply_style(ws['A3'], 'subheader')
+            ws.write(2, 0, "Monthly Traffic Breakdown", self.styles.subheader)
             
-            self._write_dataframe(ws, monthly, start_row=5)
+            self._write_dataframe(ws, monthly, start_row=4)
     
-    def _create_search_performance(self, data: Dict[str, Any]):
+    def _create_search_performance(self, report: _ReportView):
         """Create search performance sheet."""
-        ws = self.wb.create_sheet("Search Performance")
+        ws = self.wb.add_worksheet("Search Performance")
+        styles = self.styles
         
-        ws['A1'] = "Google Search Console Performance"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Google Search Console Performance", styles.title)
         
         # Overview
-        gsc = data.get('gsc', {})
-        overview = gsc.get('overview', {})
+        overview = report.search_overview
         
-        ws['A3'] = "Search Overview"
-        self._apply_style(ws['A3'], 'subheader')
+        ws.write(2, 0, "Search Overview", styles.subheader)
         
-        row = 5
+        row = 4
         for key, label in [
             ('total_clicks', 'Total Clicks'),
             ('total_impressions', 'Total Impressions'),
             ('avg_ctr', 'Average CTR (%)'),
             ('avg_position', 'Average Position'),
         ]:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = overview.get(key, 0)
-            self._apply_style(ws[f'A{row}'], 'metric_label')
-            self._apply_style(ws[f'B{row}'], 'metric_value')
+            ws.write(row, 0, label, styles.metric_label)
+            ws.write(row, 1, overview.get(key, 0), styles.metric_value)
             row += 1
         
         # Top keywords
         row += 2
-        ws[f'A{row}'] = "Top Keywords by Clicks"
-        self._apply_style(ws[f'A{row}'], 'subheader')
+        ws.write(row, 0, "Top Keywords by Clicks", styles.subheader)
         
-        keywords = gsc.get('top_keywords_clicks', pd.DataFrame())
+        keywords = report.top_keywords
         if not keywords.empty:
-            self._write_dataframe(ws, keywords.head(20), start_row=row + 2)
+            self._write_dataframe(
+                ws, keywords.head(20), start_row=row + 2,
+                column_formats={'ctr': styles.decimal_2, 'position': styles.decimal_1},
+            )
         
         # Adjust columns
-        ws.column_dimensions['A'].width = 40
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 10
-        ws.column_dimensions['E'].width = 10
+        self._set_widths(ws, [40, 12, 12, 10, 10])
     
-    def _create_content_performance(self, data: Dict[str, Any]):
+    def _create_content_performance(self, report: _ReportView):
         """Create content performance sheet."""
-        ws = self.wb.create_sheet("Content Performance")
+        ws = self.wb.add_worksheet("Content Performance")
         
-        ws['A1'] = "Top Performing Content"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Top Performing Content", self.styles.title)
         
         # Top pages
-        top_pages = data.get('ga4', {}).get('top_pages', pd.DataFrame())
+        top_pages = report.top_pages
         
+        row = 2
         if not top_pages.empty:
-            ws['A3'] = "Top Pages by Pageviews"
-            self._apply_style(ws['A3'], 'subheader')
+            ws.write(2, 0, "Top Pages by Pageviews", self.styles.subheader)
             
             # Select key columns
             display_cols = ['pageTitle', 'pagePath', 'screenPageViews', 'pct_of_total', 
                           'averageSessionDuration', 'bounceRate']
             cols_to_use = [c for c in display_cols if c in top_pages.columns]
             
-            self._write_dataframe(ws, top_pages[cols_to_use].head(15), start_row=5)
+            row = self._write_dataframe(
+                ws, top_pages.head(15), start_row=4, columns=cols_to_use,
+                column_formats={
+                    'pct_of_total': self.styles.decimal_2,
+                    'averageSessionDuration': self.styles.decimal_1,
+                    'bounceRate': self.styles.decimal_2,
+                },
+            )
         
         # Landing pages
-        landing = data.get('ga4', {}).get('landing_pages', pd.DataFrame())
+        landing = report.landing_pages
         
         if not landing.empty:
-            row = 25
-            ws[f'A{row}'] = "Top Landing Pages"
-            self._apply_style(ws[f'A{row}'], 'subheader')
+            row = max(row + 1, 24)
+            ws.write(row, 0, "Top Landing Pages", self.styles.subheader)
             
             self._write_dataframe(ws, landing.head(10), start_row=row + 2)
         
         # Adjust columns
-        ws.column_dimensions['A'].width = 50
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 12
+        self._set_widths(ws, [50, 30, 12, 12, 12])
     
-    def _create_audience_insights(self, data: Dict[str, Any]):
+    def _create_audience_insights(self, report: _ReportView):
         """Create audience insights sheet."""
-        ws = self.wb.create_sheet("Audience Insights")
+        ws = self.wb.add_worksheet("Audience Insights")
         
-        ws['A1'] = "Audience Analysis"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Audience Analysis", self.styles.title)
         
         # Device breakdown
-        devices = data.get('ga4', {}).get('device_breakdown', pd.DataFrame())
+        devices = report.devices
         
+        row = 2
         if not devices.empty:
-            ws['A3'] = "Traffic by Device"
-            self._apply_style(ws['A3'], 'subheader')
-            self._write_dataframe(ws, devices, start_row=5)
+            ws.write(2, 0, "Traffic by Device", self.styles.subheader)
+            row = self._write_dataframe(ws, devices, start_row=4)
         
         # Geography
-        geo = data.get('ga4', {}).get('geography', pd.DataFrame())
+        geo = report.geography
         
         if not geo.empty:
-            ws['A12'] = "Traffic by Country"
-            self._apply_style(ws['A12'], 'subheader')
-            self._write_dataframe(ws, geo.head(10), start_row=14)
+            row = max(row + 1, 11)
+            ws.write(row, 0, "Traffic by Country", self.styles.subheader)
+            row = self._write_dataframe(ws, geo.head(10), start_row=row + 2)
         
         # New vs Returning
-        nvr = data.get('ga4', {}).get('new_vs_returning', {})
+        nvr = report.new_vs_returning
         
         if nvr:
-            ws['A28'] = "New vs Returning Visitors"
-            self._apply_style(ws['A28'], 'subheader')
+            row = max(row + 1, 27)
+            ws.write(row, 0, "New vs Returning Visitors", self.styles.subheader)
             
-            row = 30
+            row += 2
             for user_type in ['new', 'returning']:
                 user_data = nvr.get(user_type, {})
-                ws[f'A{row}'] = user_type.title()
-                ws[f'B{row}'] = f"{user_data.get('users', 0):,} users"
-                ws[f'C{row}'] = f"{user_data.get('pct_of_total', 0)}%"
+                ws.write(row, 0, user_type.title())
+                ws.write(row, 1, f"{user_data.get('users', 0):,} users")
+                ws.write(row, 2, f"{user_data.get('pct_of_total', 0)}%")
                 row += 1
     
-    def _create_acquisition_channels(self, data: Dict[str, Any]):
+    def _create_acquisition_channels(self, report: _ReportView):
         """Create acquisition channels sheet."""
-        ws = self.wb.create_sheet("Acquisition")
+        ws = self.wb.add_worksheet("Acquisition")
         
-        ws['A1'] = "Traffic Acquisition Channels"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Traffic Acquisition Channels", self.styles.title)
         
         # Channel breakdown
-        channels = data.get('ga4', {}).get('traffic_by_channel', pd.DataFrame())
+        channels = report.channels
         
         if not channels.empty:
-            ws['A3'] = "Traffic by Channel"
-            self._apply_style(ws['A3'], 'subheader')
-            self._write_dataframe(ws, channels, start_row=5)
+            ws.write(2, 0, "Traffic by Channel", self.styles.subheader)
+            row = self._write_dataframe(ws, channels, start_row=4)
         
         # Paid search
-        paid = data.get('ga4', {}).get('paid_search', {})
+        paid = report.paid_search
         
         if paid and paid.get('sessions', 0) > 0:
-            row = len(channels) + 10 if not channels.empty else 15
-            ws[f'A{row}'] = "Paid Search Performance"
-            self._apply_style(ws[f'A{row}'], 'subheader')
+            row = row + 4 if not channels.empty else 14
+            ws.write(row, 0, "Paid Search Performance", self.styles.subheader)
             
             row += 2
             for key, label in [
@@ -398,90 +443,121 @@ class ExcelExporter:
                 ('bounce_rate', 'Bounce Rate (%)'),
                 ('avg_session_duration', 'Avg Duration (sec)'),
             ]:
-                ws[f'A{row}'] = label
-                ws[f'B{row}'] = paid.get(key, 0)
+                ws.write(row, 0, label)
+                ws.write(row, 1, paid.get(key, 0))
                 row += 1
     
-    def _create_insights_sheet(self, data: Dict[str, Any]):
+    def _create_insights_sheet(self, report: _ReportView):
         """Create insights and recommendations sheet."""
-        ws = self.wb.create_sheet("Insights")
+        ws = self.wb.add_worksheet("Insights")
+        styles = self.styles
         
-        ws['A1'] = "Analytics Insights & Recommendations"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['primary'])
+        ws.write(0, 0, "Analytics Insights & Recommendations", styles.title)
         
-        insights_data = data.get('insights', {})
-        insights_list = insights_data.get('insights', [])
+        insights_list = report.insights.get('insights', [])
         
         if not insights_list:
-            ws['A3'] = "No insights generated. Run analysis with data."
+            ws.write(2, 0, "No insights generated. Run analysis with data.")
             return
         
         # Headers
-        row = 3
+        row = 2
         headers = ['Priority', 'Category', 'Type', 'Finding', 'Recommendation']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            self._apply_style(cell, 'header')
+        ws.write_row(row, 0, headers, styles.header)
+        
+        self._set_widths(ws, [10, 12, 12, 60, 60])
         
-        ws.column_dimensions['A'].width = 10
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 60
-        ws.column_dimensions['E'].width = 60
+        # Color by type
+        type_formats = {
+            'positive': styles.positive_text,
+            'negative': styles.negative_text,
+            'opportunity': styles.opportunity_text,
+        }
         
         # Data rows
-        row = 4
+        row = 3
         for insight in insights_list:
-            ws.cell(row=row, column=1, value=insight.get('priority', ''))
-            ws.cell(row=row, column=2, value=insight.get('category', ''))
-            ws.cell(row=row, column=3, value=insight.get('type', ''))
-            ws.cell(row=row, column=4, value=insight.get('headline', ''))
-            ws.cell(row=row, column=5, value=insight.get('recommendation', ''))
-            
-            # Color by type
-            type_col = ws.cell(row=row, column=3)
-            if insight.get('type') == 'positive':
-                type_col.font = Font(color=self.COLORS['positive'])
-            elif insight.get('type') == 'negative':
-                type_col.font = Font(color=self.COLORS['negative'])
-            elif insight.get('type') == 'opportunity':
-                type_col.font = Font(color=self.COLORS['secondary'])
-            
+            ws.write(row, 0, insight.get('priority', ''))
+            ws.write(row, 1, insight.get('category', ''))
+            ws.write(row, 2, insight.get('type', ''), type_formats.get(insight.get('type')))
+            ws.write(row, 3, insight.get('headline', ''))
+            ws.write(row, 4, insight.get('recommendation', ''))
             row += 1
     
+    @staticmethod
+    def _set_widths(ws, widths: List[float]):
+        """Set column widths from column A onwards, one set_column per run of equal widths."""
+        col = 0
+        for width, run in groupby(widths):
+            span = len(list(run))
+            ws.set_column(col, col + span - 1, width)
+            col += span
+    
     def _write_dataframe(
         self,
         ws,
         df: pd.DataFrame,
-        start_row: int = 1,
-        include_index: bool = False
-    ):
-        """Write a DataFrame to worksheet with formatting."""
+        start_row: int = 0,
+        include_index: bool = False,
+        column_formats: Optional[Dict[str, Format]] = None,
+        columns: Optional[List[str]] = None
+    ) -> int:
+        """
+        Write a DataFrame to worksheet with formatting.
+        
+        Args:
+            start_row: Zero-based row for the header
+            columns: Subset of columns to write (all when omitted)
+            column_formats: Number formats for specific columns, so values
+                stay numeric in the sheet while displaying consistently
+        
+        Returns:
+            The first row below the written table
+        """
         if df.empty:
-            return
+            return start_row
+        
+        if columns is not None:
+            df = df[columns]
         
         # Headers
-        col = 1
+        headers = list(df.columns)
+        if include_index:
+            headers.insert(0, df.index.name or 'Index')
+        ws.write_row(start_row, 0, headers, self.styles.header)
+        
+        # Pick each column's write method once from its dtype, rather than
+        # letting write_row type-check every cell
+        writers = [self._column_writer(ws, column) for _, column in df.items()]
+        column_formats = column_formats or {}
+        formats = [column_formats.get(name) for name in df.columns]
         if include_index:
-            cell = ws.cell(row=start_row, column=col, value=df.index.name or 'Index')
-            self._apply_style(cell, 'header')
-            col += 1
+            writers.insert(0, ws.write)
+            formats.insert(0, None)
         
-        for header in df.columns:
-            cell = ws.cell(row=start_row, column=col, value=header)
-            self._apply_style(cell, 'header')
-            col += 1
+        # Missing values become blank cells (xlsxwriter rejects NaN). A single
+        # to_numpy().tolist() turns the whole table into plain Python rows.
+        rows = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+        if include_index:
+            rows = [[idx, *values] for idx, values in zip(df.index, rows)]
         
         # Data rows
-        row = start_row + 1
-        for idx, data_row in df.iterrows():
-            col = 1
-            if include_index:
-                ws.cell(row=row, column=col, value=idx)
-                col += 1
-            
-            for value in data_row:
-                ws.cell(row=row, column=col, value=value)
-                col += 1
-            row += 1
-
+        for row, values in enumerate(rows, start=start_row + 1):
+            for col, (write, value, cell_format) in enumerate(zip(writers, values, formats)):
+                write(row, col, value, cell_format)
+        
+        return start_row + len(df) + 1
+    
+    @staticmethod
+    def _column_writer(ws, column: pd.Series):
+        """Return the worksheet write method suited to a column's dtype."""
+        if column.hasnans:
+            # Only the generic write turns the blanked-out NaNs into empty cells
+            return ws.write
+        if pd.api.types.is_bool_dtype(column):
+            return ws.write_boolean
+        if pd.api.types.is_numeric_dtype(column):
+            return ws.write_number
+        if pd.api.types.is_string_dtype(column):
+            return ws.write_string
+        return ws.write
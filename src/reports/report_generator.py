@@ -297,12 +297,19 @@ class ReportGenerator:
         current = periods.current
         previous = periods.previous
         
+        # Both periods' overviews come back from a single request
+        traffic_overview = self._safe_fetch(
+            lambda: self.ga4.get_traffic_overview_compare(
+                current.start_date, current.end_date,
+                previous.start_date, previous.end_date
+            ),
+            "GA4 traffic overview", {}
+        )
+        current_overview = traffic_overview.get('current', {})
+        
         return {
             # Current period data
-            'traffic_overview': self._safe_fetch(
-                lambda: self.ga4.get_traffic_overview(current.start_date, current.end_date),
-                "GA4 traffic overview", {}
-            ),
+            'traffic_overview': current_overview,
             'traffic_by_month': self._safe_fetch(
                 lambda: self.ga4.get_traffic_by_month(current.start_date, current.end_date),
                 "GA4 monthly traffic"
@@ -324,7 +331,10 @@ class ReportGenerator:
                 "GA4 landing pages"
             ),
             'homepage_engagement': self._safe_fetch(
-                lambda: self.ga4.get_homepage_engagement(current.start_date, current.end_date),
+                lambda: self.ga4.get_homepage_engagement(
+                    current.start_date, current.end_date,
+                    total_pageviews=current_overview.get('pageviews')
+                ),
                 "GA4 homepage engagement", {}
             ),
             'device_breakdown': self._safe_fetch(
@@ -354,10 +364,7 @@ class ReportGenerator:
             
             # Previous period for comparison
             '_previous': {
-                'traffic_overview': self._safe_fetch(
-                    lambda: self.ga4.get_traffic_overview(previous.start_date, previous.end_date),
-                    "GA4 previous traffic overview", {}
-                ),
+                'traffic_overview': traffic_overview.get('previous', {}),
                 'traffic_by_month': self._safe_fetch(
                     lambda: self.ga4.get_traffic_by_month(previous.start_date, previous.end_date),
                     "GA4 previous monthly traffic"
@@ -435,12 +442,14 @@ class ReportGenerator:
             return {"available": False, "reason": "PageSpeed client not initialized"}
         
         try:
+            self.pagespeed.stale_since.clear()
             data = self.pagespeed.get_performance_overview()
             # Only mark as available if we actually got some data
             has_data = data.get("mobile") is not None or data.get("desktop") is not None
             data["available"] = has_data
             if not has_data:
                 data["reason"] = "PageSpeed analysis returned no data"
+            self._note_stale(data, self.pagespeed)
             return data
         except Exception as e:
             self.errors.append(f"PageSpeed fetch failed: {str(e)}")
@@ -453,11 +462,24 @@ class ReportGenerator:
         
         try:
             current = periods.current
-            return self.hotjar.get_all_insights(current.start_date, current.end_date)
+            self.hotjar.stale_since.clear()
+            data = self.hotjar.get_all_insights(current.start_date, current.end_date)
+            self._note_stale(data, self.hotjar)
+            return data
         except Exception as e:
             self.errors.append(f"Hotjar fetch failed: {str(e)}")
             return {"available": False, "reason": str(e)}
     
+    def _note_stale(self, data: Dict[str, Any], client) -> None:
+        """
+        Mark data that includes stale cached results from client.
+        
+        data_as_of is when the oldest of those results was fetched, for a
+        "data as of" note in the report.
+        """
+        if client.stale_since:
+            data["data_as_of"] = min(client.stale_since.values())
+    
     def _collect_google_ads_data(self, periods: ComparisonPeriods) -> Dict[str, Any]:
         """Collect Google Ads data."""
         if self.google_ads is None:
@@ -8,13 +8,19 @@ import json
 import hashlib
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Dict
 from functools import wraps
+from threading import Lock
+from concurrent.futures import Future
+import logging
 import diskcache
 
 from config.settings import CACHE_DIR, get_settings
 
 
+log = logging.getLogger(__name__)
+
+
 class DataCache:
     """
     Disk-based cache for API responses.
@@ -68,7 +74,42 @@ class DataCache:
         }
 
 
-def cached(ttl_hours: int = None):
+_caches: Dict[str, DataCache] = {}
+_caches_lock = Lock()
+
+
+def get_cache(client_name: str = "default") -> DataCache:
+    """
+    Get the shared DataCache for a client.
+    
+    Opening a diskcache store is relatively expensive, so one instance
+    per client is kept for the life of the process.
+    """
+    cache = _caches.get(client_name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(client_name)
+            if cache is None:
+                cache = _caches[client_name] = DataCache(client_name)
+    return cache
+
+
+def _use_stale(client: Any, func: Callable, stale: tuple) -> Any:
+    """
+    Return a stale_ok fallback entry, noting how old it is.
+    
+    The entry's timestamp is recorded in the client's stale_since dict (if
+    it has one) under the method name, so reports can say "data as of".
+    """
+    generated_at, value = stale
+    log.warning("%s failed; using cached data from %s", func.__qualname__, generated_at)
+    stale_since = getattr(client, 'stale_since', None)
+    if stale_since is not None:
+        stale_since[func.__name__] = generated_at
+    return value
+
+
+def cached(ttl_hours: int = None, stale_ok: bool = False):
     """
     Decorator to cache function results.
     
@@ -76,16 +117,23 @@ def cached(ttl_hours: int = None):
         @cached(ttl_hours=24)
         def fetch_data(start_date, end_date):
             ...
+    
+    A None result means the call failed and is not cached. With
+    stale_ok=True, successful results are also kept as a fallback for
+    cache_stale_days. If a later refresh fails (raises, or returns None),
+    the last good result is returned instead, and its timestamp is recorded
+    in the client's stale_since. Empty results such as [] are real data.
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             # Get client name from self if available
             client_name = getattr(self, 'client_name', 'default')
-            cache = DataCache(client_name)
+            cache = get_cache(client_name)
             
-            # Generate cache key
-            key = cache._make_key(func.__name__, *args, **kwargs)
+            # Generate cache key; the qualified name keeps same-named methods
+            # on different API clients (e.g. get_top_pages) apart
+            key = cache._make_key(func.__qualname__, *args, **kwargs)
             
             # Try to get from cache
             cached_value = cache.get(key)
@@ -93,7 +141,25 @@ def cached(ttl_hours: int = None):
                 return cached_value
             
             # Execute function and cache result
-            result = func(self, *args, **kwargs)
+            stale_key = f"{key}:stale"
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception:
+                stale = cache.get(stale_key) if stale_ok else None
+                if stale is None:
+                    raise
+                return _use_stale(self, func, stale)
+            
+            if result is None:
+                stale = cache.get(stale_key) if stale_ok else None
+                if stale is not None:
+                    return _use_stale(self, func, stale)
+                return None
+            
+            if stale_ok:
+                generated_at = datetime.now().isoformat(timespec='seconds')
+                stale_ttl = get_settings().cache_stale_days * 86400
+                cache.set(stale_key, (generated_at, result), ttl=stale_ttl)
             
             ttl = (ttl_hours or get_settings().cache_ttl_hours) * 3600
             cache.set(key, result, ttl=ttl)
@@ -103,9 +169,57 @@ def cached(ttl_hours: int = None):
     return decorator
 
 
+_inflight: Dict[str, Future] = {}
+_inflight_lock = Lock()
+
+
+def single_flight(func: Callable) -> Callable:
+    """
+    Decorator that coalesces concurrent identical calls.
+    
+    While a call is running, other threads calling with the same client
+    and arguments wait for its result instead of repeating the request.
+    Place it under @cached so a cache-miss storm makes one API call:
+    
+        @cached(ttl_hours=24)
+        @single_flight
+        def fetch_data(start_date, end_date):
+            ...
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        client_name = getattr(self, 'client_name', 'default')
+        key = json.dumps(
+            {"client": client_name, "func": func.__qualname__, "args": args, "kwargs": kwargs},
+            sort_keys=True
+        )
+        
+        with _inflight_lock:
+            future = _inflight.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight[key] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    return wrapper
+
+
 def clear_client_cache(client_name: str) -> None:
     """Clear all cached data for a specific client."""
-    cache = DataCache(client_name)
+    cache = get_cache(client_name)
     cache.clear()
     print(f"✓ Cleared cache for client: {client_name}")
 
@@ -113,6 +227,10 @@ def clear_client_cache(client_name: str) -> None:
 def clear_all_cache() -> None:
     """Clear all cached data."""
     import shutil
+    with _caches_lock:
+        for cache in _caches.values():
+            cache._cache.close()
+        _caches.clear()
     if CACHE_DIR.exists():
         shutil.rmtree(CACHE_DIR)
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -7,6 +7,8 @@ Professional formatting for numbers, percentages, and changes.
 from typing import Union, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class ChangeMetric:
@@ -105,6 +107,27 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {minutes}m"
 
 
+def format_duration_array(seconds: np.ndarray) -> np.ndarray:
+    """
+    Vectorized format_duration for an array of non-negative seconds.
+    
+    The unit arithmetic runs on whole-second integers in NumPy; only the
+    final string building is per element.
+    """
+    whole = np.asarray(seconds, dtype=np.float64).astype(np.int64)
+    hours = whole // 3600
+    minutes = whole // 60
+    secs = whole % 60
+    hour_minutes = (whole % 3600) // 60
+    
+    return np.array([
+        f"{s}s" if m == 0 else f"{m}m {s}s" if h == 0 else f"{h}h {hm}m"
+        for h, m, s, hm in zip(
+            hours.tolist(), minutes.tolist(), secs.tolist(), hour_minutes.tolist()
+        )
+    ], dtype=object)
+
+
 def format_ctr(ctr: float) -> str:
     """Format click-through rate."""
     return f"{ctr:.2f}%"
@@ -0,0 +1,51 @@
+"""
+HTTP Utilities
+==============
+Pooled HTTP sessions for the REST-based API clients.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests Session with connection pooling and retries.
+    
+    Reusing one session per API keeps TCP/TLS connections alive between
+    calls instead of paying a new handshake for every request. Transient
+    failures (rate limits and 5xx) are retried with a short backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def warm_up(session: requests.Session, url: str) -> None:
+    """
+    Open a pooled connection to url's host in the background.
+    
+    A HEAD request pays the TCP/TLS handshake before the first real call
+    needs the connection. Failures are ignored; the real request will
+    simply connect on its own.
+    """
+    def head() -> None:
+        try:
+            session.head(url, timeout=10)
+        except requests.RequestException:
+            pass
+    
+    threading.Thread(target=head, daemon=True).start()
@@ -0,0 +1,60 @@
+import pytest
+
+from src.utils import cache
+
+
+@pytest.fixture(autouse=True)
+def tmp_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(cache, '_caches', {})
+
+
+class _Client:
+    """Returns the queued results in order, as a client method would."""
+    
+    client_name = 'stale_test'
+    
+    def __init__(self, *results):
+        self.results = list(results)
+        self.stale_since = {}
+    
+    @cache.cached(ttl_hours=1, stale_ok=True)
+    def fetch(self, key):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _expire(key):
+    """Drop the fresh entry so the next call refreshes."""
+    store = cache.get_cache(_Client.client_name)
+    store.delete(store._make_key(_Client.fetch.__wrapped__.__qualname__, key))
+
+
+def test_failed_refresh_returns_stale_data_and_records_it():
+    client = _Client([1, 2], None, RuntimeError('down'))
+    assert client.fetch('a') == [1, 2]
+    
+    _expire('a')
+    assert client.fetch('a') == [1, 2]
+    assert 'fetch' in client.stale_since
+    
+    _expire('a')
+    assert client.fetch('a') == [1, 2]
+
+
+def test_empty_result_is_real_data():
+    client = _Client([1, 2], [])
+    client.fetch('a')
+    
+    _expire('a')
+    assert client.fetch('a') == []
+    assert client.stale_since == {}
+
+
+def test_failure_without_stale_data_is_not_cached():
+    client = _Client(None, [3])
+    
+    assert client.fetch('a') is None
+    assert client.fetch('a') == [3]
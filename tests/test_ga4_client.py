@@ -0,0 +1,103 @@
+from google.analytics.data_v1beta.types import (
+    DimensionHeader,
+    DimensionValue,
+    MetricHeader,
+    MetricType,
+    MetricValue,
+    Row,
+    RunReportResponse,
+)
+import pandas as pd
+
+from src.clients.ga4_client import (
+    GA4Client,
+    MAX_METRICS,
+    _ReportPlan,
+    _coalesce_plans,
+    _exact_match,
+)
+
+
+class _TitleReportClient:
+    """Serves a pagePath/pageTitle report, truncated to the request limit."""
+    
+    def __init__(self, titles):
+        self.titles = titles
+        self.requests = []
+    
+    def run_report(self, request):
+        self.requests.append(request)
+        rows = [
+            Row(
+                dimension_values=[DimensionValue(value=path), DimensionValue(value=title)],
+                metric_values=[MetricValue(value=str(views))],
+            )
+            for path, title, views in self.titles[:request.limit]
+        ]
+        return RunReportResponse(
+            dimension_headers=[DimensionHeader(name='pagePath'), DimensionHeader(name='pageTitle')],
+            metric_headers=[MetricHeader(name='screenPageViews', type_=MetricType.TYPE_INTEGER)],
+            rows=rows,
+            row_count=len(self.titles),
+        )
+
+
+def _client(api, default_limit=100):
+    client = object.__new__(GA4Client)
+    client.property_id = 'properties/1'
+    client._client = api
+    client._default_limit = default_limit
+    return client
+
+
+def test_page_titles_cover_more_pages_than_default_limit():
+    paths = [f'/p{i}' for i in range(250)]
+    # Every page has two titles, so the report has twice as many rows as pages
+    titles = sorted(
+        [(path, f'Title {i}', 1000 - i) for i, path in enumerate(paths)]
+        + [(path, f'Old title {i}', 10) for i, path in enumerate(paths)],
+        key=lambda row: -row[2],
+    )
+    api = _TitleReportClient(titles)
+    pages = pd.DataFrame({'pagePath': paths, 'screenPageViews': range(250)})
+    
+    df = _client(api)._attach_page_titles(pages, '2024-01-01', '2024-03-31')
+    
+    assert api.requests[0].limit >= len(titles)
+    assert (df['pageTitle'] != '').all()
+    assert df['pageTitle'].tolist() == [f'Title {i}' for i in range(250)]
+
+
+def _plan(metrics, **kwargs):
+    return _ReportPlan(metrics=metrics, process=lambda df: df, **kwargs)
+
+
+def test_coalesce_skips_merges_past_metric_limit():
+    plans = {
+        'a': _plan([f'm{i}' for i in range(6)], dimensions=['date']),
+        'b': _plan([f'm{i}' for i in range(3, 9)], dimensions=['date']),
+        'c': _plan([f'm{i}' for i in range(9, 15)], dimensions=['date']),
+    }
+    
+    groups = _coalesce_plans(plans)
+    
+    assert all(len(group.plan.metrics) <= MAX_METRICS for group in groups)
+    assert [sorted(group.members) for group in groups] == [['a', 'b'], ['c']]
+
+
+def test_row_lookup_gets_own_request_when_host_is_full():
+    plans = {
+        'channels': _plan(
+            [f'm{i}' for i in range(MAX_METRICS)],
+            dimensions=['sessionDefaultChannelGroup'],
+        ),
+        'paid': _plan(
+            ['extra'], scalar=True,
+            dimension_filter=_exact_match('sessionDefaultChannelGroup', 'Paid Search'),
+        ),
+    }
+    
+    groups = _coalesce_plans(plans)
+    
+    assert len(groups) == 2
+    assert all(len(group.plan.metrics) <= MAX_METRICS for group in groups)
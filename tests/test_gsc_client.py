@@ -0,0 +1,46 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from src.clients.gsc_client import SearchConsoleClient, _PREFETCHED, _parse_rows
+
+
+def test_parsed_ctr_and_position_keep_exact_rounded_values():
+    rows = [
+        {'keys': ['seo audit'], 'clicks': 6, 'impressions': 500,
+         'ctr': 0.012, 'position': 7.349},
+        {'keys': ['local seo'], 'clicks': 3, 'impressions': 100,
+         'ctr': 0.0333333, 'position': 12.06},
+    ]
+    
+    df = _parse_rows(rows, ['query']).to_dataframe()
+    
+    assert df['ctr'].tolist() == [1.2, 3.33]
+    assert df['position'].tolist() == [7.3, 12.1]
+
+
+class _Service:
+    """Stands in for the discovery service; requests are just their body."""
+    
+    def searchanalytics(self):
+        return self
+    
+    def query(self, siteUrl, body, fields):
+        return body
+
+
+def test_prefetched_responses_are_local_to_the_call():
+    client = object.__new__(SearchConsoleClient)
+    client.site_url = 'sc-domain:example.org'
+    client._service = _Service()
+    client._execute = lambda request: {'source': 'api'}
+    body = {'startDate': '2024-01-01', 'endDate': '2024-03-31'}
+    
+    token = _PREFETCHED.set({json.dumps(body, sort_keys=True): {'source': 'batch'}})
+    try:
+        assert client._query(body) == {'source': 'batch'}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(client._query, body).result() == {'source': 'api'}
+    finally:
+        _PREFETCHED.reset(token)
+    
+    assert client._query(body) == {'source': 'api'}
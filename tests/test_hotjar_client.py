@@ -0,0 +1,24 @@
+from src.clients.hotjar_client import HotjarClient, PAGE_SIZE
+
+
+def _client(pages):
+    """A HotjarClient whose requests return the given pages in order."""
+    client = object.__new__(HotjarClient)
+    responses = iter(pages)
+    client._make_request = lambda endpoint, params=None: next(responses)
+    return client
+
+
+def test_paginate_stops_at_short_page():
+    full = {"data": [{"id": i} for i in range(PAGE_SIZE)]}
+    short = {"data": [{"id": -1}]}
+    
+    items = _client([full, short])._paginate("feedback", {}, 3 * PAGE_SIZE)
+    
+    assert len(items) == PAGE_SIZE + 1
+
+
+def test_paginate_failed_page_is_not_partial_data():
+    full = {"data": [{"id": i} for i in range(PAGE_SIZE)]}
+    
+    assert _client([full, None])._paginate("feedback", {}, 3 * PAGE_SIZE) is None
@@ -0,0 +1,28 @@
+from src.clients.pagespeed_client import PageSpeedClient
+
+
+def _client(site_url="https://example.org"):
+    """A PageSpeedClient that records the analyses it would run."""
+    client = object.__new__(PageSpeedClient)
+    client.site_url = site_url
+    client.calls = []
+    client._analyze = lambda *args, **kwargs: client.calls.append((args, kwargs))
+    return client
+
+
+def test_homepage_requests_share_one_analysis_key():
+    client = _client()
+    
+    client.analyze_url(strategy="mobile", mode="full")
+    client.analyze_url("https://example.org/", "mobile")
+    client.analyze_url("https://example.org", "mobile")
+    
+    assert client.calls == [(("https://example.org/", "mobile", "full"), {})] * 3
+
+
+def test_page_urls_are_passed_through():
+    client = _client()
+    
+    client.analyze_url("https://example.org/donate", "desktop", "summary")
+    
+    assert client.calls == [(("https://example.org/donate", "desktop", "summary"), {})]
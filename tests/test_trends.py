@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from src.analysis.trends import TrendAnalyzer, _mean_std
+
+
+def _series(offset: float) -> pd.DataFrame:
+    noise = np.array([0.3, -0.8, 1.1, 0.0, -0.5, 0.9, -1.2, 0.4, 6.0, -0.2])
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=noise.size),
+        'value': offset + noise,
+    })
+
+
+def test_mean_std_with_large_baseline_offset():
+    values = _series(1e8)['value'].to_numpy()
+    mean_val, std_val = _mean_std(values)
+    assert np.isclose(mean_val, values.mean(), rtol=0, atol=1e-6)
+    assert np.isclose(std_val, values.std(), rtol=1e-6)
+    assert std_val > 0.5
+
+
+def test_anomalies_unaffected_by_baseline_offset():
+    analyzer = TrendAnalyzer(sensitivity=2.0)
+    # Percent deviation shrinks with the baseline, so only the std band decides
+    small = analyzer.detect_anomalies(_series(0.0), 'date', 'value', min_deviation=1e-12)
+    large = analyzer.detect_anomalies(_series(1e8), 'date', 'value', min_deviation=1e-12)
+    
+    assert [a.date for a in small] == [a.date for a in large]
+    assert len(large) == 1
+    
+    columns = analyzer.detect_anomalies_columnar(_series(1e8), 'date', 'value', min_deviation=1e-12)
+    assert len(columns['value']) == 1
+
+
+def test_non_numeric_object_column_falls_back():
+    data = pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=6),
+        'sessions': pd.Series([10, 12, 'n/a', 11, 13, 40], dtype=object),
+    })
+    analyzer = TrendAnalyzer()
+    
+    assert analyzer.analyze_trend(data, 'date', 'sessions').description == "Unable to calculate trend"
+    assert analyzer.detect_anomalies(data, 'date', 'sessions') == []